@@ -4,14 +4,21 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Iterator, Optional, Tuple
 
+from app.utils.cache import BoundedCache
 from app.utils.config import Config
 from app.services.project_settings import (
     build_default_ai_settings,
     load_project_ai_models,
 )
 
+# Gemini adapters hold an API client and a Redis-backed rate limiter, so they are
+# reused across tasks. Keys are the settings an adapter reads when it is built.
+_GEMINI_ADAPTER_CACHE: BoundedCache[
+    tuple[str, str, int, tuple[tuple[str, str], ...]], BaseAIAdapter
+] = BoundedCache(maxsize=16)
+
 
 class BaseAIAdapter(ABC):
     """Minimal interface required by the Validator and Archivist engines."""
@@ -62,6 +69,20 @@ class BaseAIAdapter(ABC):
 
         raise NotImplementedError
 
+    def generate_text_stream(
+        self,
+        prompt: str,
+        model_key: str | None = None,
+    ) -> Iterator[Tuple[str, Optional[Dict[str, int]]]]:
+        """Yield ``(chunk, usage)`` pairs while a text response is generated.
+
+        ``usage`` is ``None`` until the adapter knows the token usage; the last
+        non-``None`` value covers the whole response. Adapters without native
+        streaming yield the complete :meth:`generate_text` result as one chunk.
+        """
+
+        yield self.generate_text(prompt, model_key=model_key)
+
     def count_tokens(self, text: str) -> int:
         """Best-effort token counting for adapters that support it."""
 
@@ -220,6 +241,26 @@ def get_default_ai_adapter(config: Config) -> BaseAIAdapter:
     return HeuristicAIAdapter(config=config)
 
 
+def _get_gemini_adapter(config: Config, api_key: str, model: str) -> BaseAIAdapter:
+    """Return a cached :class:`GeminiAdapter` built from ``config`` for ``model``."""
+
+    cache_key = (
+        api_key,
+        model,
+        config.gemini_rate_limit_rpm(),
+        tuple(sorted(config.get_ai_model_aliases().items())),
+    )
+    cached = _GEMINI_ADAPTER_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    from app.adapters.ai.gemini import GeminiAdapter
+
+    adapter = GeminiAdapter(config=config, model=model)
+    _GEMINI_ADAPTER_CACHE.set(cache_key, adapter)
+    return adapter
+
+
 def get_ai_adapters(
     config: Config, project_id: int | None = None
 ) -> tuple[BaseAIAdapter, BaseAIAdapter]:
@@ -231,11 +272,10 @@ def get_ai_adapters(
         models = build_default_ai_settings(config)
 
     provider = config.ai_provider()
-    if provider == "gemini" and config.get_gemini_api_key():
-        from app.adapters.ai.gemini import GeminiAdapter
-
-        validator = GeminiAdapter(config=config, model=models["validation"])
-        writer = GeminiAdapter(config=config, model=models["generation"])
+    api_key = config.get_gemini_api_key()
+    if provider == "gemini" and api_key:
+        validator = _get_gemini_adapter(config, api_key, models["validation"])
+        writer = _get_gemini_adapter(config, api_key, models["generation"])
         return validator, writer
 
     heuristic = HeuristicAIAdapter(config=config)
@@ -0,0 +1,111 @@
+"""Redis-backed cache for text completions returned by AI adapters."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+from typing import Callable, Dict, Optional, Tuple
+
+from app.db.redis_client import get_redis_client
+from app.utils.serialization import json_loads
+
+logger = logging.getLogger(__name__)
+
+CompletionResult = Tuple[str, Optional[Dict[str, int]]]
+
+_ZERO_USAGE = {
+    "input": 0,
+    "output": 0,
+    "total": 0,
+    "prompt_token_count": 0,
+    "candidates_token_count": 0,
+    "total_tokens": 0,
+}
+
+
+def completion_cache_key(adapter: object, prompt: str, model_key: str | None) -> str:
+    """Return the Redis key identifying a completion request."""
+
+    digest = hashlib.sha256()
+    for part in (
+        type(adapter).__name__,
+        str(getattr(adapter, "model", "")),
+        model_key or "",
+        prompt,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return f"completion:{digest.hexdigest()}"
+
+
+def get_cached_completion(
+    adapter, prompt: str, model_key: str | None
+) -> CompletionResult | None:
+    """Return a cached completion with zeroed usage metadata, if one exists."""
+
+    if adapter.config.completion_cache_ttl() <= 0:
+        return None
+
+    cache_key = completion_cache_key(adapter, prompt, model_key)
+    try:
+        cached = get_redis_client().get(cache_key)
+    except Exception:  # pragma: no cover - network/redis dependent
+        return None
+    if not cached:
+        return None
+
+    logger.info("Serving completion from cache (%s).", cache_key)
+    return json_loads(cached)["text"], dict(_ZERO_USAGE)
+
+
+def store_completion(adapter, prompt: str, model_key: str | None, text: str) -> None:
+    """Remember ``text`` as the completion for ``prompt`` unless it is empty."""
+
+    ttl = adapter.config.completion_cache_ttl()
+    if ttl <= 0 or not text:
+        return
+
+    try:
+        get_redis_client().setex(
+            completion_cache_key(adapter, prompt, model_key),
+            ttl,
+            json.dumps({"text": text}, ensure_ascii=False),
+        )
+    except Exception as exc:  # pragma: no cover - network/redis dependent
+        logger.debug("Failed to cache completion: %s", exc)
+
+
+def completion_cache(
+    func: Callable[..., CompletionResult],
+) -> Callable[..., CompletionResult]:
+    """Serve repeated ``generate_text`` calls from Redis.
+
+    When enabled through :meth:`Config.completion_cache_ttl`, identical prompts
+    sent to the same adapter and model within the TTL return the stored text
+    with zeroed usage metadata, so retried or resumed tasks are not billed
+    twice. Empty responses are never cached.
+    """
+
+    @functools.wraps(func)
+    def wrapper(
+        self, prompt: str, model_key: str | None = None, *args, **kwargs
+    ) -> CompletionResult:
+        cached = get_cached_completion(self, prompt, model_key)
+        if cached is not None:
+            return cached
+
+        text, usage = func(self, prompt, model_key, *args, **kwargs)
+        store_completion(self, prompt, model_key, text)
+        return text, usage
+
+    return wrapper
+
+
+__all__ = [
+    "completion_cache",
+    "completion_cache_key",
+    "get_cached_completion",
+    "store_completion",
+]
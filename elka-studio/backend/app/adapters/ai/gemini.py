@@ -6,7 +6,7 @@ import re
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from celery.exceptions import MaxRetriesExceededError, Retry
 from google import genai
@@ -17,6 +17,11 @@ from limits.storage import MemoryStorage, RedisStorage
 from limits.strategies import MovingWindowRateLimiter
 
 from app.adapters.ai.base import BaseAIAdapter
+from app.adapters.ai.completion_cache import (
+    completion_cache,
+    get_cached_completion,
+    store_completion,
+)
 from app.utils.config import Config
 
 
@@ -154,6 +159,7 @@ class GeminiAdapter(BaseAIAdapter):
         metadata["total"] = metadata["total_tokens"]
         return metadata
 
+    @completion_cache
     def generate_text(
         self, prompt: str, model_key: str | None = None
     ) -> tuple[str, dict | None]:
@@ -241,6 +247,44 @@ class GeminiAdapter(BaseAIAdapter):
 
         raise RuntimeError("Gemini text generation failed without a captured exception")
 
+    def generate_text_stream(
+        self, prompt: str, model_key: str | None = None
+    ) -> Iterator[tuple[str, dict | None]]:
+        """Stream a text response, falling back to :meth:`generate_text`.
+
+        Errors raised before the first chunk arrives are retried through the
+        non-streaming path, which owns the rate limit and retry handling; errors
+        after partial output has been yielded are propagated.
+        """
+
+        cached = get_cached_completion(self, prompt, model_key)
+        if cached is not None:
+            yield cached
+            return
+
+        model_name = self._resolve_model(model_key)
+        self._wait_for_rate_limit()
+
+        started = False
+        chunks: list[str] = []
+        try:
+            for response in self._client.models.generate_content_stream(
+                model=model_name, contents=prompt
+            ):
+                started = True
+                chunk = getattr(response, "text", None) or ""
+                chunks.append(chunk)
+                yield chunk, self._extract_usage_metadata(response)
+            store_completion(self, prompt, model_key, "".join(chunks))
+        except Exception as exc:
+            if isinstance(exc, Retry) or started:
+                raise
+            self.logger.warning(
+                "Gemini streaming failed before any output (%s); retrying without streaming.",
+                exc,
+            )
+            yield self.generate_text(prompt, model_key=model_key)
+
     def analyse(
         self,
         story_content: str,
@@ -11,6 +11,7 @@ import git
 from git.exc import GitCommandError
 
 from app.utils.config import Config
+from app.utils.filesystem import write_text_if_changed
 
 
 class GitAdapter:
@@ -51,8 +52,7 @@ class GitAdapter:
         written: list[Path] = []
         for relative, content in files.items():
             destination = self.project_path / relative
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            destination.write_text(content, encoding="utf-8")
+            write_text_if_changed(destination, content, create_parents=True)
             written.append(destination)
         return written
 
@@ -86,8 +86,7 @@ class GitAdapter:
 
         for file in changeset.files:
             destination = self.project_path / file.path
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            destination.write_text(file.new, encoding="utf-8")
+            write_text_if_changed(destination, file.new, create_parents=True)
 
     def commit_all(self, message: str, author=None) -> str:
         """Commit all staged and unstaged changes and return the commit SHA."""
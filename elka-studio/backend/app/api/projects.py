@@ -23,7 +23,7 @@ from ..services.git_manager import GitManager
 from ..tasks import uce_process_story_task
 from ..utils.config import load_config
 from ..utils.filesystem import sanitize_filename
-from ..utils.security import decrypt, encrypt, get_secret_key
+from ..utils.security import decrypt, decrypt_default, encrypt, get_secret_key
 
 logger = logging.getLogger(__name__)
 
@@ -413,8 +413,7 @@ async def import_stories(
     token: str | None = None
     if project.git_token:
         try:
-            secret_key = get_secret_key()
-            token = decrypt(project.git_token, secret_key)
+            token = decrypt_default(project.git_token)
         except Exception as exc:  # pragma: no cover - defensive branch
             logger.exception(
                 "Failed to decrypt git token for project %s during import.",
@@ -622,8 +621,7 @@ def reset_project_universe(
     git_manager = GitManager(str(local_path.parent))
 
     try:
-        secret_key = get_secret_key()
-        token = decrypt(project.git_token, secret_key) if project.git_token else None
+        token = decrypt_default(project.git_token) if project.git_token else None
     except Exception as exc:
         logger.exception("Failed to decrypt token for project reset")
         raise HTTPException(
@@ -10,18 +10,19 @@ from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
+from ..db.redis_client import publish_task_state
 from ..db.session import get_session
 from ..models.project import Project
 from ..models.task import Task, TaskStatus
 from ..utils.security import decrypt, get_secret_key
-from ..services.task_manager import TaskManager
+from ..services.task_manager import get_task_manager
 from ..core.context import app_context
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 logger = logging.getLogger(__name__)
 
-task_manager = TaskManager()
+task_manager = get_task_manager()
 
 
 _CAMEL_CASE_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
@@ -285,6 +286,7 @@ def _update_task_status(session: Session, task_id: int, status_value: str) -> Ta
     session.add(task)
     session.commit()
     session.refresh(task)
+    publish_task_state(task.id, status_value)
     task_manager.broadcast_update(task.project_id)
     return task
 
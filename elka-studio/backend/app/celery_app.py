@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 
 
 def _load_broker_url() -> str:
@@ -13,6 +14,25 @@ def _load_broker_url() -> str:
     return os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 
 
+def _load_task_routes() -> dict[str, dict[str, str]]:
+    """Return task routes, sending lore tasks to ``ELKA_LORE_QUEUE`` when set.
+
+    Lore tasks spend most of their time waiting on AI providers and Git, so a
+    dedicated queue lets them run on a worker with a thread pool (for example
+    ``celery worker -P threads -c 16 -Q lore_io``) while other tasks stay on
+    the default prefork worker. The token flushes queued by lore tasks follow
+    them, so every worker that produces token counts also drains them.
+    """
+
+    lore_queue = os.getenv("ELKA_LORE_QUEUE", "").strip()
+    if not lore_queue:
+        return {}
+    return {
+        "app.tasks.lore_tasks.*": {"queue": lore_queue},
+        "app.tasks.flush_task_tokens": {"queue": lore_queue},
+    }
+
+
 celery_app = Celery(
     "elka_studio",
     broker=_load_broker_url(),
@@ -25,9 +45,28 @@ celery_app.conf.update(
     accept_content=["json"],
     timezone="UTC",
     enable_utc=True,
+    task_routes=_load_task_routes(),
 )
 
 celery_app.autodiscover_tasks(["app.tasks"])
 
 
+@worker_process_init.connect
+def _warm_up_worker(**_: object) -> None:
+    """Build shared adapters once per worker process instead of per task."""
+
+    from app.core.context import app_context
+
+    app_context.warm_up()
+
+
+@worker_process_shutdown.connect
+def _release_worker_resources(**_: object) -> None:
+    """Close pooled Git handles when a worker process exits."""
+
+    from app.core.context import app_context
+
+    app_context.release_worker_resources()
+
+
 __all__ = ["celery_app"]
@@ -6,7 +6,7 @@ import logging
 import re
 import unicodedata
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple, Union
 
@@ -14,6 +14,11 @@ import frontmatter
 import yaml
 from pydantic import ValidationError
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 try:
     from frontmatter import FrontmatterError
 except ImportError:  # pragma: no cover - fallback
@@ -27,7 +32,7 @@ except ImportError:  # pragma: no cover - fallback
 from app.adapters.ai.base import BaseAIAdapter
 from app.adapters.git.base import GitAdapter
 from app.utils.config import Config
-from app.utils.filesystem import sanitize_filename
+from app.utils.filesystem import sanitize_filename, write_text_if_changed
 
 from git.exc import GitCommandError
 
@@ -185,8 +190,7 @@ class ArchivistEngine:
         )
 
         try:
-            absolute_path.parent.mkdir(parents=True, exist_ok=True)
-            absolute_path.write_text(story_content, encoding="utf-8")
+            write_text_if_changed(absolute_path, story_content, create_parents=True)
             logger.info("Story file saved: %s", absolute_path)
         except OSError as exc:
             logger.error("Failed to write story file %s: %s", absolute_path, exc)
@@ -205,7 +209,7 @@ class ArchivistEngine:
                 fallback_name
             )
             try:
-                fallback_path.write_text(story_content, encoding="utf-8")
+                write_text_if_changed(fallback_path, story_content)
                 logger.info("Story file saved to fallback path: %s", fallback_path)
                 absolute_path = fallback_path
             except OSError as fallback_exc:
@@ -228,7 +232,7 @@ class ArchivistEngine:
             "summary": summary,
             "filename": relative_path_obj.name,
             "relative_path": relative_path,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
         }
         if saga_slug:
             metadata["saga_folder"] = str(saga_directory)
@@ -253,10 +257,11 @@ class ArchivistEngine:
             logger.error("Failed to extract entities from story: %s", exc)
 
         if extracted_data is not None:
-            logger.info(
-                "Archiving extracted data: %s",
-                extracted_data.model_dump_json(indent=2),
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Archiving extracted data: %s",
+                    extracted_data.model_dump_json(indent=2),
+                )
             if (
                 not extracted_data.characters
                 and not extracted_data.locations
@@ -346,7 +351,7 @@ class ArchivistEngine:
         if base_name not in existing:
             return base_name
 
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
         counter = 1
         candidate = f"{base_name}-{timestamp}"
         while candidate in existing:
@@ -493,14 +498,12 @@ class ArchivistEngine:
             fact_entity = fact_entity.model_copy(update={"type": "Misc"})
         filename = f"{fact_entity.id}.md"
         entity_directory = Path("Entities") / subfolder
-        absolute_directory_path = self.project_path / entity_directory
-        absolute_directory_path.mkdir(parents=True, exist_ok=True)
-        file_path = absolute_directory_path / filename
+        file_path = self.project_path / entity_directory / filename
         content = self._format_document(fact_entity)
 
         logger.info("Writing entity file: %s", file_path)
         try:
-            file_path.write_text(content, encoding="utf-8")
+            write_text_if_changed(file_path, content, create_parents=True)
             logger.info("Successfully wrote entity file: %s", file_path)
         except OSError as exc:  # pragma: no cover - filesystem interaction
             logger.error("Failed to write entity file %s: %s", file_path, exc)
@@ -757,7 +760,7 @@ def _parse_front_matter(text: str) -> dict[str, str]:
     if not match:
         return {}
     try:
-        data = yaml.safe_load(match.group("body")) or {}
+        data = yaml.load(match.group("body"), Loader=_YamlLoader) or {}
     except yaml.YAMLError:  # pragma: no cover - defensive parsing
         return {}
     if not isinstance(data, dict):
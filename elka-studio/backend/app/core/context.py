@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import threading
+from pathlib import Path
 from threading import Lock
 from typing import Optional
 
@@ -10,6 +12,7 @@ from app.adapters.ai.base import BaseAIAdapter, get_ai_adapters
 from app.adapters.git.base import GitAdapter
 from app.core.archivist import ArchivistEngine
 from app.core.validator import ValidatorEngine
+from app.db.session import engine
 from app.models.project import Project
 from app.services.git_manager import GitManager
 from app.utils.config import Config
@@ -39,6 +42,10 @@ class AppContext:
         self._validator_ai: Optional[BaseAIAdapter] = None
         self._writer_ai: Optional[BaseAIAdapter] = None
         self._validator: Optional[ValidatorEngine] = None
+        # Git adapters per thread ident, kept process-wide so shutdown can
+        # close the handles of every worker thread.
+        self._git_adapters: dict[int, dict[int, tuple[tuple, GitAdapter]]] = {}
+        self._git_adapters_lock = Lock()
 
     @property
     def ai_adapter(self) -> BaseAIAdapter:
@@ -77,9 +84,41 @@ class AppContext:
         self._writer_ai = writer
 
     def create_git_adapter(self, project: Project) -> GitAdapter:
-        project_path = self.git_manager.resolve_project_path(project)
+        """Return a Git adapter for ``project``, reusing this thread's handle.
+
+        GitPython keeps persistent ``git cat-file --batch`` processes per
+        repository handle, so reusing the adapter across tasks spares every
+        chapter of a saga from respawning them. Handles are kept per thread
+        because GitPython repositories are not thread-safe, and are replaced
+        when the path, token or repository directory changes.
+        """
+
+        project_path = Path(self.git_manager.resolve_project_path(project))
         token = self._resolve_git_token(project)
-        return GitAdapter(project_path=project_path, config=self.config, token=token)
+        adapters: dict[int, tuple[tuple, GitAdapter]] = self._thread_git_adapters()
+
+        try:
+            repository_inode = (project_path / ".git").stat().st_ino
+        except OSError:
+            repository_inode = None
+        cache_key = (str(project_path), token, repository_inode)
+
+        cached = adapters.pop(project.id, None)
+        if cached is not None:
+            cached_key, cached_adapter = cached
+            if cached_key == cache_key and repository_inode is not None:
+                adapters[project.id] = cached
+                return cached_adapter
+            cached_adapter.repo.close()
+
+        adapter = GitAdapter(project_path=project_path, config=self.config, token=token)
+        if repository_inode is not None:
+            adapters[project.id] = (cache_key, adapter)
+        return adapter
+
+    def _thread_git_adapters(self) -> dict[int, tuple[tuple, GitAdapter]]:
+        with self._git_adapters_lock:
+            return self._git_adapters.setdefault(threading.get_ident(), {})
 
     def create_archivist(
         self,
@@ -96,6 +135,34 @@ class AppContext:
             model_overrides=model_overrides,
         )
 
+    def warm_up(self) -> None:
+        """Prepare shared services before a worker process takes its first task.
+
+        Builds the default AI adapters and validator, which also imports the
+        provider SDKs, and drops Git handles and pooled database connections
+        inherited from the parent process. Failures are logged and left for the
+        first task to report.
+        """
+
+        self._git_adapters = {}
+        self._git_adapters_lock = Lock()
+        # Leave the parent's connections alone; this process opens its own.
+        engine.dispose(close=False)
+        try:
+            _ = self.validator
+        except Exception as exc:  # pragma: no cover - depends on AI configuration
+            logger.warning("Skipping AI adapter warm-up: %s", exc)
+
+    def release_worker_resources(self) -> None:
+        """Close the pooled Git handles of every thread."""
+
+        with self._git_adapters_lock:
+            thread_adapters = list(self._git_adapters.values())
+            self._git_adapters = {}
+        for adapters in thread_adapters:
+            for _, adapter in adapters.values():
+                adapter.repo.close()
+
     def _resolve_git_token(self, project: Project) -> str | None:
         encrypted = project.git_token
         if not encrypted:
@@ -7,6 +7,9 @@ from functools import lru_cache
 
 import redis
 
+# Cached task statuses only shortcut lookups; a missing key falls back to the DB.
+TASK_STATUS_TTL_SECONDS = 24 * 60 * 60
+
 
 def _load_redis_url() -> str:
     """Return the Redis connection URL based on the Celery configuration."""
@@ -21,4 +24,61 @@ def get_redis_client() -> redis.Redis:
     return redis.Redis.from_url(_load_redis_url(), decode_responses=True)
 
 
-__all__ = ["get_redis_client"]
+def task_state_channel(task_db_id: int) -> str:
+    """Return the pub/sub channel announcing status changes of a task."""
+
+    return f"task:{task_db_id}:state"
+
+
+def task_status_key(task_db_id: int) -> str:
+    """Return the key caching the latest status written for a task."""
+
+    return f"task:{task_db_id}:status"
+
+
+def cache_task_status(task_db_id: int, status: str) -> None:
+    """Remember ``status`` as the current status of ``task_db_id``."""
+
+    try:
+        get_redis_client().setex(
+            task_status_key(task_db_id), TASK_STATUS_TTL_SECONDS, str(status)
+        )
+    except Exception:  # pragma: no cover - network/redis dependent
+        pass
+
+
+def get_cached_task_status(task_db_id: int) -> str | None:
+    """Return the cached status of ``task_db_id`` or ``None`` when unknown."""
+
+    try:
+        return get_redis_client().get(task_status_key(task_db_id))
+    except Exception:  # pragma: no cover - network/redis dependent
+        return None
+
+
+def publish_task_state(task_db_id: int, status: str) -> None:
+    """Announce ``status`` to workers waiting on ``task_db_id``, ignoring errors.
+
+    The status is cached under :func:`task_status_key` in the same round trip.
+    """
+
+    try:
+        pipeline = get_redis_client().pipeline(transaction=False)
+        pipeline.setex(
+            task_status_key(task_db_id), TASK_STATUS_TTL_SECONDS, str(status)
+        )
+        pipeline.publish(task_state_channel(task_db_id), str(status))
+        pipeline.execute()
+    except Exception:  # pragma: no cover - network/redis dependent
+        pass
+
+
+__all__ = [
+    "TASK_STATUS_TTL_SECONDS",
+    "cache_task_status",
+    "get_cached_task_status",
+    "get_redis_client",
+    "publish_task_state",
+    "task_state_channel",
+    "task_status_key",
+]
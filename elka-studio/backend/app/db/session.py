@@ -9,6 +9,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from ..utils.config import load_config
+from ..utils.serialization import json_dumps_compact, json_loads
 
 _config = load_config()
 _storage_config = _config.get("storage", {})
@@ -18,7 +19,15 @@ _database_path = Path(
 _database_path.parent.mkdir(parents=True, exist_ok=True)
 
 database_url = f"sqlite:///{_database_path}"
-engine = create_engine(database_url, connect_args={"check_same_thread": False})
+# Task params/results can carry whole diffs; orjson keeps JSON columns cheap.
+engine = create_engine(
+    database_url,
+    connect_args={"check_same_thread": False},
+    # Worker processes keep pooled connections across tasks; check them first.
+    pool_pre_ping=True,
+    json_serializer=json_dumps_compact,
+    json_deserializer=json_loads,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -2,6 +2,6 @@
 
 from .ai_adapter_factory import AIAdapterFactory
 from .git_manager import GitManager
-from .task_manager import TaskManager
+from .task_manager import TaskManager, get_task_manager
 
-__all__ = ["AIAdapterFactory", "GitManager", "TaskManager"]
+__all__ = ["AIAdapterFactory", "GitManager", "TaskManager", "get_task_manager"]
@@ -4,15 +4,23 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Callable, Tuple
 
 from celery import chain
+from celery.canvas import Signature
 from celery.result import AsyncResult
+from celery.utils import uuid
 from sqlalchemy.orm import Session
 
 
-from app.db.redis_client import get_redis_client
+from app.db.redis_client import (
+    cache_task_status,
+    get_redis_client,
+    publish_task_state,
+)
 from app.db.session import SessionLocal
 from app.models.project import Project, Setting
 from app.models.task import Task, TaskStatus
@@ -20,6 +28,7 @@ from app.core.context import app_context
 from app.api.websockets import manager as ws_manager
 from app.tasks.base import dummy_task
 from app.tasks import lore_tasks
+from app.utils.cache import BoundedCache
 
 
 TASK_MAPPING = {
@@ -43,6 +52,101 @@ TASK_MAPPING = {
 }
 
 
+# Identical progress-only updates sent within this window are not re-written.
+REDUNDANT_UPDATE_WINDOW_SECONDS = 0.5
+
+
+class StatusBuffer:
+    """Coalesce consecutive progress updates for a task into single writes.
+
+    Messages recorded through :meth:`log` are held in memory and written with
+    one :meth:`TaskManager.update_task_status` call when the buffer is flushed:
+    explicitly, when the status changes, once ``flush_interval`` seconds have
+    passed since the previous write, or when used as a context manager, on exit.
+    Callers should flush before long-running work so clients see progress.
+    """
+
+    def __init__(
+        self,
+        manager: TaskManager,
+        celery_task_id: str,
+        status: str = TaskStatus.RUNNING,
+        *,
+        flush_interval: float = 5.0,
+    ) -> None:
+        self._manager = manager
+        self._celery_task_id = celery_task_id
+        self._status = status
+        self._flush_interval = flush_interval
+        self._messages: list[str] = []
+        self._progress: int | None = None
+        self._result: dict[str, Any] | None = None
+        self._input_tokens = 0
+        self._output_tokens = 0
+        self._last_flush = time.monotonic()
+
+    def __enter__(self) -> StatusBuffer:
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.flush()
+
+    def log(
+        self,
+        message: str | None = None,
+        *,
+        progress: int | None = None,
+        result: dict[str, Any] | None = None,
+        status: str | None = None,
+        input_tokens: int | None = None,
+        output_tokens: int | None = None,
+    ) -> None:
+        """Record an update, flushing pending entries first on a status change."""
+
+        if status is not None and status != self._status:
+            self.flush()
+            self._status = status
+        if message:
+            self._messages.append(message)
+        if progress is not None:
+            self._progress = progress
+        if result is not None:
+            self._result = {**(self._result or {}), **deepcopy(result)}
+        self._input_tokens += max(int(input_tokens or 0), 0)
+        self._output_tokens += max(int(output_tokens or 0), 0)
+
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every pending entry with a single status update."""
+
+        if not (
+            self._messages
+            or self._progress is not None
+            or self._result is not None
+            or self._input_tokens
+            or self._output_tokens
+        ):
+            return
+
+        self._manager.update_task_status(
+            self._celery_task_id,
+            self._status,
+            progress=self._progress,
+            log_message="\n".join(self._messages) or None,
+            result=self._result,
+            input_tokens=self._input_tokens,
+            output_tokens=self._output_tokens,
+        )
+        self._messages = []
+        self._progress = None
+        self._result = None
+        self._input_tokens = 0
+        self._output_tokens = 0
+        self._last_flush = time.monotonic()
+
+
 class TaskManager:
     """High-level orchestration for scheduling and tracking background tasks."""
 
@@ -51,6 +155,9 @@ class TaskManager:
         self._redis_client = get_redis_client()
         self.config = app_context.config
         self.logger = logging.getLogger(__name__)
+        self._last_status_writes: BoundedCache[str, tuple[str, int | None, float]] = (
+            BoundedCache(maxsize=1024)
+        )
 
     def get_project_ai_models(self, project_id: int) -> dict[str, str]:
         """
@@ -131,6 +238,87 @@ class TaskManager:
 
         return task
 
+    def create_task_signature(
+        self,
+        project_id: int,
+        task_type: str,
+        params: dict | None = None,
+        *,
+        parent_task_id: int | None = None,
+    ) -> Tuple[Task, Signature]:
+        """Create a task record and return an immutable signature for its job.
+
+        Nothing is dispatched; callers compose the returned signatures into a
+        canvas (for example a chain) and enqueue it themselves. The Celery task
+        id is assigned up front so status updates resolve the record as soon
+        as the job starts.
+        """
+
+        return self.create_task_signatures(
+            project_id, task_type, [params or {}], parent_task_id=parent_task_id
+        )[0]
+
+    def create_task_signatures(
+        self,
+        project_id: int,
+        task_type: str,
+        params_list: list[dict],
+        *,
+        parent_task_id: int | None = None,
+        previous_task_param: str | None = None,
+    ) -> list[Tuple[Task, Signature]]:
+        """Create task records in one transaction and return their signatures.
+
+        Signatures are built as in :meth:`create_task_signature`. When ``previous_task_param`` is given, every job after the first receives
+        the database id of the preceding record under that keyword argument so
+        the signatures can be linked into a chain. The link is passed to the
+        job only and is not stored with the persisted parameters.
+        """
+
+        if task_type not in TASK_MAPPING:
+            raise ValueError(f"Unknown task type '{task_type}'.")
+
+        try:
+            project_id_int = int(project_id)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("project_id must be an integer") from exc
+
+        tasks = [
+            Task(
+                project_id=project_id_int,
+                type=task_type,
+                status=TaskStatus.PENDING,
+                params=deepcopy(params) or None,
+                parent_task_id=parent_task_id,
+                celery_task_id=uuid(),
+            )
+            for params in params_list
+        ]
+        session = self._session_factory()
+        session.expire_on_commit = False
+        try:
+            session.add_all(tasks)
+            session.commit()
+            session.expunge_all()
+        finally:
+            session.close()
+
+        created: list[Tuple[Task, Signature]] = []
+        previous_task_id: int | None = None
+        for task, params in zip(tasks, params_list):
+            job_params = dict(params)
+            job_params.setdefault("project_id", project_id_int)
+            if previous_task_param is not None:
+                job_params[previous_task_param] = previous_task_id
+            signature = (
+                TASK_MAPPING[task_type]
+                .si(task.id, **job_params)
+                .set(task_id=task.celery_task_id)
+            )
+            created.append((task, signature))
+            previous_task_id = task.id
+        return created
+
     def update_task_field(self, celery_task_id: str, field: str, value: Any) -> None:
         """Update a single task field and broadcast the change."""
 
@@ -188,11 +376,35 @@ class TaskManager:
         *,
         input_tokens: int | None = None,
         output_tokens: int | None = None,
+        keep_paused: bool = False,
     ) -> None:
-        """Persist task status changes and broadcast them to websocket clients."""
+        """Persist task status changes and broadcast them to websocket clients.
+
+        Updates that carry no log message, result or tokens and repeat the
+        status and progress written less than
+        ``REDUNDANT_UPDATE_WINDOW_SECONDS`` ago are skipped. With
+        ``keep_paused`` a task found paused keeps its status; the check runs on
+        the row being updated, so a pause cannot slip in between.
+        """
+
+        now = time.monotonic()
+        carries_payload = bool(
+            log_message or result is not None or input_tokens or output_tokens
+        )
+        previous = self._last_status_writes.get(celery_task_id)
+        if (
+            not carries_payload
+            and previous is not None
+            and previous[0] == status
+            and progress in (None, previous[1])
+            and now - previous[2] < REDUNDANT_UPDATE_WINDOW_SECONDS
+        ):
+            return
 
         session = self._session_factory()
         project_id: int | None = None
+        resumed_task_id: int | None = None
+        changed_task_id: int | None = None
         try:
             task = (
                 session.query(Task)
@@ -202,6 +414,12 @@ class TaskManager:
             if not task:
                 return
 
+            if keep_paused and task.status == TaskStatus.PAUSED:
+                status = task.status
+            if task.status != status:
+                changed_task_id = task.id
+                if task.status == TaskStatus.PAUSED:
+                    resumed_task_id = task.id
             task.status = status
             if progress is not None:
                 task.progress = progress
@@ -233,9 +451,26 @@ class TaskManager:
         finally:
             session.close()
 
+        self._last_status_writes.set(celery_task_id, (status, progress, now))
+        if resumed_task_id is not None:
+            # Wake workers blocked in _wait_while_paused on this task.
+            publish_task_state(resumed_task_id, status)
+        elif changed_task_id is not None:
+            cache_task_status(changed_task_id, status)
         if project_id is not None:
             self._broadcast_update(project_id)
 
+    def status_buffer(
+        self,
+        celery_task_id: str,
+        status: str = TaskStatus.RUNNING,
+        *,
+        flush_interval: float = 5.0,
+    ) -> StatusBuffer:
+        """Return a :class:`StatusBuffer` that batches updates for the task."""
+
+        return StatusBuffer(self, celery_task_id, status, flush_interval=flush_interval)
+
     def update_task_status_by_db_id(
         self,
         task_db_id: int,
@@ -246,6 +481,7 @@ class TaskManager:
         *,
         input_tokens: int | None = None,
         output_tokens: int | None = None,
+        keep_paused: bool = False,
     ) -> None:
         """Helper to update task status when only the database ID is known."""
 
@@ -269,8 +505,38 @@ class TaskManager:
             result=result,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            keep_paused=keep_paused,
         )
 
+    def fail_pending_tasks(self, task_ids: list[int], log_message: str) -> None:
+        """Mark the given tasks as failed if they have not started yet."""
+
+        if not task_ids:
+            return
+
+        session = self._session_factory()
+        project_ids: set[int] = set()
+        failed_ids: list[int] = []
+        try:
+            tasks = (
+                session.query(Task)
+                .filter(Task.id.in_(task_ids), Task.status == TaskStatus.PENDING)
+                .all()
+            )
+            for task in tasks:
+                task.status = TaskStatus.FAILURE
+                task.log = f"{task.log}\n{log_message}" if task.log else log_message
+                project_ids.add(task.project_id)
+                failed_ids.append(task.id)
+            session.commit()
+        finally:
+            session.close()
+
+        for task_id in failed_ids:
+            cache_task_status(task_id, TaskStatus.FAILURE)
+        for project_id in project_ids:
+            self._broadcast_update(project_id)
+
     def approve_task(self, task_id: int, session: Session | None = None) -> Task:
         """Mark the task result as approved and finalise any pending changes."""
 
@@ -467,4 +733,11 @@ class TaskManager:
             session.close()
 
 
-__all__ = ["TaskManager"]
+@lru_cache(maxsize=1)
+def get_task_manager() -> TaskManager:
+    """Return the process-wide :class:`TaskManager` shared by tasks and the API."""
+
+    return TaskManager()
+
+
+__all__ = ["StatusBuffer", "TaskManager", "get_task_manager"]
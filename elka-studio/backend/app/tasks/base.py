@@ -8,6 +8,9 @@ from typing import Any
 from celery import Task
 from google.api_core.exceptions import ResourceExhausted
 from celery.utils.log import get_task_logger
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from sqlalchemy.exc import OperationalError
 
 from app.celery_app import celery_app
 from app.db.session import SessionLocal
@@ -16,12 +19,23 @@ from app.models.task import Task as TaskModel, TaskStatus
 
 logger = get_task_logger(__name__)
 
+# Failures that usually clear up on their own: provider quotas, a locked or
+# unreachable database and broker/network hiccups.
+RETRYABLE_EXCEPTIONS = (
+    ResourceExhausted,
+    OperationalError,
+    RedisConnectionError,
+    RedisTimeoutError,
+    ConnectionError,
+    TimeoutError,
+)
+
 
 class BaseTask(Task):
     """Base class providing helpers for concrete Celery tasks."""
 
     abstract = True
-    autoretry_for = (ResourceExhausted,)
+    autoretry_for = RETRYABLE_EXCEPTIONS
     retry_kwargs = {"max_retries": 5}
     retry_backoff = True
     retry_backoff_max = 600
@@ -50,44 +64,84 @@ class BaseTask(Task):
                 self.db_task_id = None
         return super().__call__(*args, **kwargs)
 
+    def will_retry(self, exc: BaseException) -> bool:
+        """Return whether Celery will automatically retry the task after ``exc``.
+
+        Task bodies use this to skip marking the record as failed when another
+        attempt is still coming.
+        """
+
+        if not isinstance(exc, self.autoretry_for):
+            return False
+        max_retries = self.retry_kwargs.get("max_retries", self.max_retries)
+        return max_retries is None or self.request.retries < max_retries
+
     def update_db_task_tokens(self, input_tokens: int, output_tokens: int) -> None:
-        """Persist aggregated token counters for the current task."""
+        """Queue a write of the aggregated token counters for the current task.
+
+        The write runs as a high-priority :func:`flush_task_tokens`, routed to
+        the queue the lore workers consume (see ``app.celery_app``), so the
+        task can return without waiting on the database. When the broker is
+        unavailable the counters are persisted inline instead.
+        """
 
         if not getattr(self, "db_task_id", None):
             return
 
         try:
-            with SessionLocal() as session:
-                task = session.get(TaskModel, self.db_task_id)
-                if task is None:
-                    return
-                safe_input = max(int(input_tokens or 0), 0)
-                safe_output = max(int(output_tokens or 0), 0)
-
-                current_input = task.total_input_tokens or 0
-                current_output = task.total_output_tokens or 0
-                task.total_input_tokens = max(current_input, safe_input)
-                task.total_output_tokens = max(current_output, safe_output)
-
-                existing_input = task.input_tokens or 0
-                existing_output = task.output_tokens or 0
-                task.input_tokens = max(existing_input, safe_input)
-                task.output_tokens = max(existing_output, safe_output)
-                session.add(task)
-                session.commit()
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.error(
-                "Failed to persist token counters for task %s: %s", self.db_task_id, exc
+            flush_task_tokens.apply_async(
+                args=(self.db_task_id, input_tokens, output_tokens),
+                priority=0,
+            )
+        except Exception as exc:  # pragma: no cover - network/redis dependent
+            logger.warning(
+                "Failed to queue token counters for task %s: %s", self.db_task_id, exc
             )
+            persist_task_tokens(self.db_task_id, input_tokens, output_tokens)
+
+
+def persist_task_tokens(task_db_id: int, input_tokens: int, output_tokens: int) -> None:
+    """Store token counters on the task record, never lowering existing values."""
+
+    try:
+        with SessionLocal() as session:
+            task = session.get(TaskModel, task_db_id)
+            if task is None:
+                return
+            safe_input = max(int(input_tokens or 0), 0)
+            safe_output = max(int(output_tokens or 0), 0)
+
+            current_input = task.total_input_tokens or 0
+            current_output = task.total_output_tokens or 0
+            task.total_input_tokens = max(current_input, safe_input)
+            task.total_output_tokens = max(current_output, safe_output)
+
+            existing_input = task.input_tokens or 0
+            existing_output = task.output_tokens or 0
+            task.input_tokens = max(existing_input, safe_input)
+            task.output_tokens = max(existing_output, safe_output)
+            session.add(task)
+            session.commit()
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.error(
+            "Failed to persist token counters for task %s: %s", task_db_id, exc
+        )
+
+
+@celery_app.task(name="app.tasks.flush_task_tokens", ignore_result=True)
+def flush_task_tokens(task_db_id: int, input_tokens: int, output_tokens: int) -> None:
+    """Persist token counters queued by :meth:`BaseTask.update_db_task_tokens`."""
+
+    persist_task_tokens(task_db_id, input_tokens, output_tokens)
 
 
 @celery_app.task(bind=True, base=BaseTask, name="app.tasks.dummy_task")
 def dummy_task(self, task_db_id: int, **_: object) -> None:
     """A demonstrative long-running task that reports progress back to the API."""
 
-    from app.services.task_manager import TaskManager
+    from app.services.task_manager import get_task_manager
 
-    manager = TaskManager()
+    manager = get_task_manager()
     celery_task_id = self.request.id
 
     try:
@@ -124,4 +178,10 @@ def dummy_task(self, task_db_id: int, **_: object) -> None:
         raise
 
 
-__all__ = ["BaseTask", "dummy_task"]
+__all__ = [
+    "RETRYABLE_EXCEPTIONS",
+    "BaseTask",
+    "dummy_task",
+    "flush_task_tokens",
+    "persist_task_tokens",
+]
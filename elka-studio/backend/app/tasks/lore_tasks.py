@@ -3,35 +3,164 @@
 from __future__ import annotations
 
 import difflib
+import hashlib
+import io
 import json
 import logging
 import os
+import re
+import subprocess
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from textwrap import dedent
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+from celery import chain
 from celery.exceptions import Retry
-from celery.result import AsyncResult
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session
 
-from app.adapters.ai.base import get_ai_adapters
+from app.adapters.ai.base import BaseAIAdapter, get_ai_adapters
 from app.celery_app import celery_app
 from app.core.context import app_context
 from app.core.archivist import ArchivistEngine, load_universe
-from app.core.schemas import TaskType
+from app.core.schemas import ChangesetFile, ConsistencyIssue, FactGraph, TaskType
 from app.core.extractor import _slugify, extract_fact_graph
 from app.core.planner import plan_changes
 from app.core.validator import ValidatorEngine, validate_universe
+from app.db.redis_client import (
+    get_cached_task_status,
+    get_redis_client,
+    task_state_channel,
+)
 from app.db.session import SessionLocal
 from app.models.project import Project
 from app.models.task import Task, TaskStatus
 from app.tasks.base import BaseTask
+from app.utils.cache import BoundedCache
 from app.utils.filesystem import sanitize_filename
+from app.utils.serialization import (
+    json_dumps_compact,
+    json_dumps_pretty,
+    json_loads,
+)
 from app.services.project_settings import load_project_ai_models
 
 logger = logging.getLogger(__name__)
 
+_CHAPTER_WRITING_INSTRUCTIONS = dedent(
+    """
+    ## Writing Instructions
+    - Write only the full prose for Chapter {chapter_index} of {total_chapters}.
+    - Maintain continuity with earlier chapters and foreshadow future beats only when supported by the outline.
+    - Use expressive Markdown prose suitable for publication.
+    - Do not include commentary about other chapters or meta analysis.
+    - Return only the chapter content in Markdown format.
+    """
+).strip()
+
+_CHAPTER_VERIFIER_PROMPT = dedent(
+    """
+    You are reviewing a draft chapter of a saga against its plan.
+
+    ## Chapter {chapter_index} Plan
+    {chapter_plan_text}
+
+    ## Draft
+    {draft}
+
+    Rate how faithfully and fluently the draft realises the plan on a scale
+    from 0.0 (unusable) to 1.0 (ready to publish).
+    Respond strictly in JSON: {{"score": 0.0}}
+    """
+).strip()
+
+_SAGA_PLANNING_PROMPT = dedent(
+    """
+    You are designing an epic saga set within the established universe context.
+
+    ## Universe Context
+    {full_context_string}
+
+    Craft a cohesive saga inspired by the theme "{theme}" that spans exactly {chapters} chapters.
+    Respond strictly in JSON with the following structure:
+    {{
+      "saga_title": "...",
+      "logline": "...",
+      "chapters": [
+        {{
+          "index": 1,
+          "title": "...",
+          "summary": "...",
+          "key_events": ["...", "..."]
+        }}
+      ]
+    }}
+
+    Each chapter summary must reference previous developments to maintain continuity.
+    """
+).strip()
+
+
+_STORY_PROMPT_TEMPLATE = """
+**Full Universe Context:**
+---
+{full_context_string}
+---
+**End of Full Universe Context**
+
+**Instruction:** Based **strictly and solely** on the **Full Universe Context** provided above, continue the story for project '{project_name}'.
+The specific idea to develop is: **'{seed}'**.
+Ensure the generated story is deeply consistent with **all** aspects of the established lore, characters, locations, events, timeline, and writing style found in the context. Output only the new story content in Markdown format. Do not repeat the context.
+
+**Seed idea:** {seed}
+
+**Generated Story:**
+""".strip()
+
+_DEFAULT_STORY_BODY = dedent(
+    """
+    ## Opening
+    The saga opens by expanding upon the latest creative direction while respecting the canon of {project_name}.
+
+    ## Rising Action
+    Characters evolve as new tensions surface, ensuring the narrative remains faithful to the established universe.
+
+    ## Resolution
+    The immediate conflict reaches a satisfying conclusion while leaving deliberate threads for future chronicles.
+    """
+).strip()
+
+_STORY_FRONT_MATTER = (
+    "---\n"
+    'title: "{title}"\n'
+    'author: "{author}"\n'
+    "generated_at: {generated_at}\n"
+    'seed: "{seed}"\n'
+    'project: "{project}"\n'
+    "---\n"
+)
+_CHAPTER_FRONT_MATTER = (
+    "---\n"
+    'title: "{title}"\n'
+    'author: "{author}"\n'
+    "chapter: {chapter}\n"
+    "total_chapters: {total_chapters}\n"
+    'saga_title: "{saga_title}"\n'
+    "generated_at: {generated_at}\n"
+    "{outline}"
+    "---\n"
+)
+
+
+def _utc_timestamp(moment: datetime | None = None) -> str:
+    """Return ``moment`` (default: now) as an ISO 8601 UTC string ending in ``Z``."""
+
+    return (moment or datetime.now(timezone.utc)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
 
 def _escape_front_matter(value: str) -> str:
     text = (value or "").strip()
@@ -51,38 +180,25 @@ def _build_story_document(
     resolved_author = story_author.strip() or "eLKA Author"
     body = (generated_body or "").strip()
     if not body:
-        body = dedent(
-            f"""
-            ## Opening
-            The saga opens by expanding upon the latest creative direction while respecting the canon of {project.name}.
-
-            ## Rising Action
-            Characters evolve as new tensions surface, ensuring the narrative remains faithful to the established universe.
-
-            ## Resolution
-            The immediate conflict reaches a satisfying conclusion while leaving deliberate threads for future chronicles.
-            """
-        ).strip()
+        body = _DEFAULT_STORY_BODY.format(project_name=project.name)
     if not body.endswith("\n"):
         body = f"{body}\n"
 
     timestamp_utc = datetime.now(timezone.utc).replace(microsecond=0)
-    generated_at = timestamp_utc.isoformat().replace("+00:00", "Z")
+    generated_at = _utc_timestamp(timestamp_utc)
     sanitized_title = sanitize_filename(resolved_title, default="story")
     story_filename = f"{sanitized_title}-{timestamp_utc.strftime('%Y%m%d-%H%M%S')}.md"
     relative_path = Path("stories") / story_filename
-    front_matter_lines = [
-        "---",
-        f'title: "{_escape_front_matter(resolved_title)}"',
-        f'author: "{_escape_front_matter(resolved_author)}"',
-        f"generated_at: {generated_at}",
-        f'seed: "{_escape_front_matter(seed)}"',
-        f'project: "{_escape_front_matter(project.name)}"',
-        "---",
-        "",
-    ]
-    document = "\n".join(front_matter_lines) + body
-    return document, relative_path
+    front_matter = _STORY_FRONT_MATTER.format_map(
+        {
+            "title": _escape_front_matter(resolved_title),
+            "author": _escape_front_matter(resolved_author),
+            "generated_at": generated_at,
+            "seed": _escape_front_matter(seed),
+            "project": _escape_front_matter(project.name),
+        }
+    )
+    return front_matter + body, relative_path
 
 
 def _extract_json_payload(raw_text: str) -> Dict[str, Any]:
@@ -93,14 +209,14 @@ def _extract_json_payload(raw_text: str) -> Dict[str, Any]:
         raise ValueError("Planner response was empty")
 
     try:
-        return json.loads(cleaned)
+        return json_loads(cleaned)
     except json.JSONDecodeError:
         start = cleaned.find("{")
         end = cleaned.rfind("}")
         if start != -1 and end != -1 and end > start:
             snippet = cleaned[start : end + 1]
             try:
-                return json.loads(snippet)
+                return json_loads(snippet)
             except json.JSONDecodeError as exc:
                 raise ValueError("Failed to parse JSON planner response") from exc
         raise ValueError("Planner response did not contain JSON data")
@@ -116,8 +232,13 @@ def _build_chapter_document(
     author: str,
     generated_body: str,
     story_directory: Path,
+    generated_at: str | None = None,
 ) -> tuple[str, Path, str]:
-    """Create a chapter document with YAML front matter."""
+    """Create a chapter document with YAML front matter.
+
+    Sagas pass one ``generated_at`` timestamp for all of their chapters; when
+    omitted the current time is used.
+    """
 
     resolved_saga_title = saga_title.strip() if saga_title else project.name
     plan_title = (chapter_plan or {}).get("title")
@@ -128,67 +249,313 @@ def _build_chapter_document(
         else resolved_chapter_title
     )
 
-    timestamp_utc = datetime.now(timezone.utc).replace(microsecond=0)
-    generated_at = timestamp_utc.isoformat().replace("+00:00", "Z")
+    if generated_at is None:
+        generated_at = _utc_timestamp()
     sanitized_name = sanitize_filename(
         f"{chapter_index:02d}-{resolved_chapter_title}",
         default=f"chapter-{chapter_index:02d}",
     )
     relative_path = story_directory / f"{sanitized_name}.md"
 
-    front_matter_lines = [
-        "---",
-        f'title: "{_escape_front_matter(combined_title)}"',
-        f'author: "{_escape_front_matter(author)}"',
-        f"chapter: {chapter_index}",
-        f"total_chapters: {total_chapters}",
-        f'saga_title: "{_escape_front_matter(resolved_saga_title)}"',
-        f"generated_at: {generated_at}",
-    ]
-
+    outline_block = ""
     if chapter_plan:
-        outline_text = json.dumps(chapter_plan, ensure_ascii=False, indent=2)
-        front_matter_lines.append("outline: |")
-        front_matter_lines.extend([f"  {line}" for line in outline_text.splitlines()])
-
-    front_matter_lines.extend(["---", ""])
+        outline_lines = json_dumps_pretty(chapter_plan).splitlines()
+        outline_block = "".join(f"  {line}\n" for line in outline_lines)
+        outline_block = f"outline: |\n{outline_block}"
+    front_matter = _CHAPTER_FRONT_MATTER.format_map(
+        {
+            "title": _escape_front_matter(combined_title),
+            "author": _escape_front_matter(author),
+            "chapter": chapter_index,
+            "total_chapters": total_chapters,
+            "saga_title": _escape_front_matter(resolved_saga_title),
+            "generated_at": generated_at,
+            "outline": outline_block,
+        }
+    )
 
     body = generated_body.strip()
     if not body.endswith("\n"):
         body = f"{body}\n"
 
-    document = "\n".join(front_matter_lines) + body
-    return document, relative_path, combined_title
+    return front_matter + body, relative_path, combined_title
+
 
+def _iter_chapter_prompt_sections(
+    *,
+    full_context_string: str,
+    outline_text: str,
+    chapter_index: int,
+    total_chapters: int,
+    chapter_plan_text: str | None,
+    previous_chapter_content: str | None,
+) -> Iterator[str]:
+    """Yield the lines of a chapter prompt, skipping absent optional sections."""
+
+    yield "You are an expert saga author continuing a multi-chapter narrative."
+    yield ""
+    yield "## Universe Context"
+    yield full_context_string
+    yield ""
+    yield "## Saga Outline"
+    yield outline_text
+
+    if chapter_plan_text:
+        yield ""
+        yield f"## Chapter {chapter_index} Plan"
+        yield chapter_plan_text
+
+    if previous_chapter_content:
+        yield ""
+        yield "## Previous Chapter Content"
+        yield previous_chapter_content.strip()
+
+    yield ""
+    yield _CHAPTER_WRITING_INSTRUCTIONS.format(
+        chapter_index=chapter_index, total_chapters=total_chapters
+    )
+
+
+def _stream_chapter_text(
+    manager,
+    celery_task_id: str,
+    writer_ai,
+    prompt: str,
+    *,
+    model_key: str | None,
+) -> tuple[str, Dict[str, int] | None]:
+    """Stream a chapter from ``writer_ai``, publishing partial text as it grows.
 
-def _get_current_status(task_db_id: int) -> TaskStatus | None:
+    Each preview stores and broadcasts the whole text so far, so previews are
+    throttled to one per ``_STREAM_PREVIEW_INTERVAL_SECONDS``.
+    """
+
+    chunks: List[str] = []
+    usage_metadata: Dict[str, int] | None = None
+    published_at = time.monotonic()
+    for chunk, chunk_usage in writer_ai.generate_text_stream(
+        prompt, model_key=model_key
+    ):
+        if chunk:
+            chunks.append(chunk)
+        if chunk_usage is not None:
+            usage_metadata = chunk_usage
+        now = time.monotonic()
+        if now - published_at >= _STREAM_PREVIEW_INTERVAL_SECONDS:
+            manager.update_task_field(celery_task_id, "story_content", "".join(chunks))
+            published_at = now
+    return "".join(chunks), usage_metadata
+
+
+def _score_chapter_draft(
+    verifier_ai,
+    draft: str,
+    *,
+    chapter_index: int,
+    chapter_plan_text: str,
+    model_key: str | None = None,
+) -> tuple[float, Dict[str, int] | None]:
+    """Return a 0-1 verifier score for ``draft``; unparsable replies score 0.
+
+    Without ``model_key`` the adapter's own model is used.
+    """
+
+    response, usage_metadata = verifier_ai.generate_text(
+        _CHAPTER_VERIFIER_PROMPT.format(
+            chapter_index=chapter_index,
+            chapter_plan_text=chapter_plan_text,
+            draft=draft,
+        ),
+        model_key=model_key,
+    )
+    try:
+        score = float(_extract_json_payload(response).get("score", 0.0))
+    except (TypeError, ValueError, AttributeError):
+        score = 0.0
+    return score, usage_metadata
+
+
+def _load_project_resources(
+    project_id: int,
+) -> tuple[Project, Path, Dict[str, str], tuple[BaseAIAdapter, BaseAIAdapter]]:
+    """Load the project, its AI model map and its adapters concurrently."""
+
+    project_future = _IO_EXECUTOR.submit(_get_project, project_id)
+    models_future = _IO_EXECUTOR.submit(
+        load_project_ai_models, app_context.config, project_id
+    )
+    adapters_future = _IO_EXECUTOR.submit(
+        get_ai_adapters, app_context.config, project_id=project_id
+    )
+
+    project, project_path = project_future.result()
+    return project, project_path, models_future.result(), adapters_future.result()
+
+
+def _get_project(project_id: int) -> tuple[Project, Path]:
+    """Return the detached project record and its local path.
+
+    Both are cached for ``_PROJECT_CACHE_TTL_SECONDS`` so the tasks of a saga
+    or a story chain do not each query the project and stat its directory.
+    """
+
+    cached = _PROJECT_CACHE.get(project_id)
+    if cached is not None:
+        return cached
+
+    project = app_context.git_manager.get_project_from_db(project_id)
+    project_path = Path(app_context.git_manager.resolve_project_path(project))
+    _PROJECT_CACHE.set(project_id, (project, project_path))
+    return project, project_path
+
+
+# Built once so SQLAlchemy's compiled-statement cache is hit on every check.
+_TASK_STATUS_QUERY = select(Task.status).where(Task.id == bindparam("task_id"))
+
+
+def _get_current_status(
+    task_db_id: int, session: Session | None = None
+) -> TaskStatus | None:
+    """Return the stored status of ``task_db_id``.
+
+    Callers checking the status repeatedly can pass an open ``session`` to avoid
+    checking out a new connection for every query.
+    """
+
+    if session is not None:
+        return session.execute(
+            _TASK_STATUS_QUERY, {"task_id": task_db_id}
+        ).scalar_one_or_none()
+
+    with SessionLocal() as own_session:
+        return _get_current_status(task_db_id, own_session)
+
+
+def _get_task_result(task_db_id: int) -> Dict[str, Any]:
     session = SessionLocal()
     try:
-        status: TaskStatus | None = (
-            session.query(Task.status).filter(Task.id == task_db_id).scalar()
-        )
+        result = session.query(Task.result).filter(Task.id == task_db_id).scalar()
     finally:
         session.close()
 
-    return status
+    return result if isinstance(result, dict) else {}
 
 
-def _wait_while_paused(task_db_id: int, interval_seconds: int = 30) -> None:
-    while True:
-        status = _get_current_status(task_db_id)
+def _get_task_results(task_db_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """Return the stored results of ``task_db_ids`` using a single query."""
 
-        if status != TaskStatus.PAUSED:
-            break
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(Task.id, Task.result).where(Task.id.in_(task_db_ids))
+        ).all()
+    return {
+        task_id: result if isinstance(result, dict) else {} for task_id, result in rows
+    }
 
-        logger.info(
-            "Task %s is paused; waiting %s seconds before rechecking.",
-            task_db_id,
-            interval_seconds,
+
+def _pending_child_task_ids(parent_task_id: int) -> List[int]:
+    """Return the ids of ``parent_task_id``'s child tasks that have not started."""
+
+    with SessionLocal() as session:
+        return list(
+            session.execute(
+                select(Task.id).where(
+                    Task.parent_task_id == parent_task_id,
+                    Task.status == TaskStatus.PENDING,
+                )
+            ).scalars()
         )
-        time.sleep(interval_seconds)
 
 
-def _load_full_universe_context(project_path: Path, project_id: int) -> str:
+def _wait_while_paused(
+    task_db_id: int, interval_seconds: int = 30
+) -> TaskStatus | None:
+    """Block while ``task_db_id`` is paused and return the status it left with.
+
+    The database is the source of truth; Redis only wakes the worker up.
+    Resumes are announced on :func:`task_state_channel`, after which the
+    status is re-read. Without a message the database is checked every
+    ``interval_seconds``, which also covers status changes made without
+    publishing. Without Redis the function falls back to polling the
+    database, backing off from one second up to ``interval_seconds``. A
+    status cached in Redis as paused skips the initial query, since the
+    status is read again right after subscribing.
+    """
+
+    session = SessionLocal()
+    if get_cached_task_status(task_db_id) != TaskStatus.PAUSED:
+        status = _get_current_status(task_db_id, session)
+        if status != TaskStatus.PAUSED:
+            session.close()
+            return status
+
+    pubsub = None
+    try:
+        pubsub = get_redis_client().pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(task_state_channel(task_db_id))
+    except Exception:  # pragma: no cover - network/redis dependent
+        pubsub = None
+
+    poll_delay = 1.0
+    try:
+        # Re-check after subscribing so a resume published in between is not missed.
+        status = _get_current_status(task_db_id, session)
+        while status == TaskStatus.PAUSED:
+            wait_seconds = interval_seconds if pubsub is not None else poll_delay
+            logger.info(
+                "Task %s is paused; waiting up to %s seconds for it to resume.",
+                task_db_id,
+                wait_seconds,
+            )
+            if pubsub is not None:
+                try:
+                    pubsub.get_message(timeout=wait_seconds)
+                except Exception:  # pragma: no cover - network/redis dependent
+                    pubsub = None
+            else:
+                time.sleep(wait_seconds)
+                poll_delay = min(poll_delay * 2, interval_seconds)
+
+            # End the previous read transaction so the query sees fresh data.
+            session.rollback()
+            status = _get_current_status(task_db_id, session)
+    finally:
+        session.close()
+        if pubsub is not None:
+            pubsub.close()
+    return status
+
+
+_UNIVERSE_CONTEXT_CACHE: BoundedCache[tuple[int, str], str] = BoundedCache(maxsize=8)
+_UNIVERSE_GRAPH_CACHE: BoundedCache[tuple[str, str], FactGraph] = BoundedCache(
+    maxsize=8
+)
+_STORY_ANALYSIS_CACHE: BoundedCache[
+    tuple[str, ...], tuple[FactGraph, List[ConsistencyIssue]]
+] = BoundedCache(maxsize=32)
+# Project settings can change through the API, so cached records expire quickly.
+_PROJECT_CACHE_TTL_SECONDS = 60
+_PROJECT_CACHE: BoundedCache[int, tuple[Project, Path]] = BoundedCache(
+    maxsize=128, ttl=_PROJECT_CACHE_TTL_SECONDS
+)
+_UNIVERSE_CONTEXT_TTL_SECONDS = 6 * 60 * 60
+# Streamed chapters publish their partial text at most this often.
+_STREAM_PREVIEW_INTERVAL_SECONDS = 1.0
+_CONTEXT_BLOCK_PATTERN = re.compile(r"(?=^--- START FILE: )", re.MULTILINE)
+_CONTEXT_LABEL_PATTERN = re.compile(r"^--- START FILE: (.*) ---$", re.MULTILINE)
+_CONTEXT_TERM_PATTERN = re.compile(r"\w{3,}")
+_PINNED_CONTEXT_DIRECTORIES = {"Instructions", "Pokyny"}
+_SAGA_OUTLINE_TTL_SECONDS = 24 * 60 * 60
+_DIFF_PREVIEW_MAX_TOTAL_CHARS = 1 << 20
+# difflib's cost grows with line counts; below this spawning git costs more.
+_HISTOGRAM_DIFF_MIN_LINES = 400
+# Threads are started lazily on first submit, i.e. after prefork workers fork.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="lore-io")
+
+
+def _universe_context_sources(project_path: Path) -> List[tuple[Path, str]]:
+    """Return ``(path, label)`` pairs for every file included in the context."""
+
     include_dirs = [
         "Stories",
         "Legends",
@@ -214,55 +581,128 @@ def _load_full_universe_context(project_path: Path, project_id: int) -> str:
             entry.strip() for entry in env_files.split(os.pathsep) if entry.strip()
         ] or include_files
 
-    full_context_string = ""
-    try:
-        for item_name in include_dirs:
-            item_path = project_path / item_name
-            if not item_path.is_dir():
-                continue
-            for pattern in ("*.txt", "*.md"):
-                for filepath in item_path.rglob(pattern):
-                    if not filepath.is_file():
-                        continue
-                    relative_path = filepath.relative_to(project_path)
-                    full_context_string += f"--- START FILE: {relative_path} ---\n"
-                    try:
-                        full_context_string += (
-                            filepath.read_text(encoding="utf-8") + "\n"
-                        )
-                    except (
-                        Exception
-                    ) as exc:  # pragma: no cover - filesystem interaction
-                        if isinstance(exc, Retry):
-                            raise
-                        logger.warning("Could not read file %s: %s", filepath, exc)
-                    full_context_string += f"--- END FILE: {relative_path} ---\n\n"
-
-        for file_name in include_files:
-            if not file_name:
-                continue
-            file_path = project_path / file_name
-            if not file_path.is_file():
-                continue
-            full_context_string += f"--- START FILE: {file_name} ---\n"
-            try:
-                full_context_string += file_path.read_text(encoding="utf-8") + "\n"
-            except Exception as exc:  # pragma: no cover - filesystem interaction
-                if isinstance(exc, Retry):
-                    raise
-                logger.warning("Could not read file %s: %s", file_path, exc)
-            full_context_string += f"--- END FILE: {file_name} ---\n\n"
-
-        if not full_context_string:
-            full_context_string = "No universe context files found or loaded."
-            logger.warning("Universe context is empty for project %s.", project_id)
+    sources: List[tuple[Path, str]] = []
+    for item_name in include_dirs:
+        item_path = project_path / item_name
+        if not item_path.is_dir():
+            continue
+        for pattern in ("*.txt", "*.md"):
+            for filepath in item_path.rglob(pattern):
+                if not filepath.is_file():
+                    continue
+                sources.append((filepath, str(filepath.relative_to(project_path))))
+
+    for file_name in include_files:
+        if not file_name:
+            continue
+        file_path = project_path / file_name
+        if not file_path.is_file():
+            continue
+        sources.append((file_path, file_name))
+
+    return sources
+
+
+def _universe_context_revision(sources: List[tuple[Path, str]]) -> str:
+    """Return a cheap fingerprint of the context files based on ``stat`` data.
+
+    Archived chapters are written to the working tree before they are committed,
+    so the Git HEAD alone does not identify the context; file sizes and
+    modification times do, without reading any content.
+    """
+
+    digest = hashlib.sha256()
+    for filepath, label in sources:
+        stat_result = filepath.stat()
+        digest.update(
+            f"{label}\0{stat_result.st_mtime_ns}\0{stat_result.st_size}\n".encode()
+        )
+    return digest.hexdigest()[:16]
+
+
+def _read_universe_context(
+    sources: List[tuple[Path, str]], project_id: int
+) -> tuple[str, bool]:
+    """Concatenate the context files and report whether every read succeeded."""
+
+    def _read(filepath: Path) -> str | None:
+        try:
+            return filepath.read_text(encoding="utf-8")
+        except Exception as exc:  # pragma: no cover - filesystem interaction
+            logger.warning("Could not read file %s: %s", filepath, exc)
+            return None
+
+    contents = _IO_EXECUTOR.map(_read, [filepath for filepath, _ in sources])
+
+    parts: List[str] = []
+    complete = True
+    for (_, label), content in zip(sources, contents):
+        parts.append(f"--- START FILE: {label} ---\n")
+        if content is None:
+            complete = False
         else:
-            word_count = len(full_context_string.split())
-            logger.info(
-                "Loaded full context for project %s (approx. %s words).",
+            parts.append(content + "\n")
+        parts.append(f"--- END FILE: {label} ---\n\n")
+
+    full_context_string = "".join(parts)
+    if not full_context_string:
+        full_context_string = "No universe context files found or loaded."
+        logger.warning("Universe context is empty for project %s.", project_id)
+    else:
+        word_count = len(full_context_string.split())
+        logger.info(
+            "Loaded full context for project %s (approx. %s words).",
+            project_id,
+            word_count,
+        )
+    return full_context_string, complete
+
+
+def _load_full_universe_context(project_path: Path, project_id: int) -> str:
+    """Return the universe context, reusing cached copies for the same revision.
+
+    Context strings are cached in-process and in Redis under
+    ``uce:{project_id}:{revision}``; any change to the included files rotates
+    the revision and therefore invalidates the cached value.
+    """
+
+    try:
+        sources = _universe_context_sources(project_path)
+        revision = _universe_context_revision(sources)
+
+        cache_key = (project_id, revision)
+        cached = _UNIVERSE_CONTEXT_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug(
+                "Using in-process universe context for project %s (%s).",
                 project_id,
-                word_count,
+                revision,
             )
+            return cached
+
+        redis_key = f"uce:{project_id}:{revision}"
+        try:
+            cached = get_redis_client().get(redis_key)
+        except Exception:  # pragma: no cover - network/redis dependent
+            cached = None
+        if cached:
+            logger.debug(
+                "Using Redis universe context for project %s (%s).",
+                project_id,
+                revision,
+            )
+            _UNIVERSE_CONTEXT_CACHE.set(cache_key, cached)
+            return cached
+
+        full_context_string, complete = _read_universe_context(sources, project_id)
+        if complete:
+            _UNIVERSE_CONTEXT_CACHE.set(cache_key, full_context_string)
+            try:
+                get_redis_client().setex(
+                    redis_key, _UNIVERSE_CONTEXT_TTL_SECONDS, full_context_string
+                )
+            except Exception:  # pragma: no cover - network/redis dependent
+                pass
     except Exception as exc:  # pragma: no cover - filesystem interaction
         if isinstance(exc, Retry):
             raise
@@ -276,6 +716,370 @@ def _load_full_universe_context(project_path: Path, project_id: int) -> str:
     return full_context_string
 
 
+def _select_relevant_context(
+    full_context_string: str, query: str, max_tokens: int
+) -> str:
+    """Return the context files most relevant to ``query`` within ``max_tokens``.
+
+    Tokens are approximated by whitespace-separated words. Top-level files and
+    writing instructions are always kept; the remaining files are ranked by how
+    many distinct query terms they mention and added until the budget is spent.
+    Files keep their original order, and the full context is returned untouched
+    when it already fits or ``max_tokens`` is not positive.
+    """
+
+    if max_tokens <= 0 or len(full_context_string.split()) <= max_tokens:
+        return full_context_string
+
+    blocks = [
+        block for block in _CONTEXT_BLOCK_PATTERN.split(full_context_string) if block
+    ]
+    if len(blocks) < 2:
+        return full_context_string
+
+    query_terms = {term.lower() for term in _CONTEXT_TERM_PATTERN.findall(query)}
+    pinned: List[int] = []
+    ranked: List[tuple[int, float, int]] = []
+    for position, block in enumerate(blocks):
+        label_match = _CONTEXT_LABEL_PATTERN.match(block)
+        label_parts = Path(label_match.group(1)).parts if label_match else ()
+        if len(label_parts) <= 1 or label_parts[0] in _PINNED_CONTEXT_DIRECTORIES:
+            pinned.append(position)
+            continue
+        block_terms = {term.lower() for term in _CONTEXT_TERM_PATTERN.findall(block)}
+        matches = len(query_terms & block_terms)
+        ranked.append((matches, matches / (len(block_terms) or 1), position))
+
+    selected: set[int] = set()
+    budget = max_tokens
+    for position in pinned:
+        budget -= len(blocks[position].split())
+        selected.add(position)
+    for matches, _density, position in sorted(ranked, reverse=True):
+        if not matches:
+            break
+        size = len(blocks[position].split())
+        if size <= budget:
+            selected.add(position)
+            budget -= size
+
+    logger.info(
+        "Selected %s of %s universe context files for a %s-token budget.",
+        len(selected),
+        len(blocks),
+        max_tokens,
+    )
+    return "".join(blocks[position] for position in sorted(selected))
+
+
+def _share_universe_context(full_context_string: str) -> str | None:
+    """Store ``full_context_string`` in Redis and return its content hash.
+
+    Child tasks receive only the hash in their parameters, which keeps the
+    broker payload small while sparing each of them a reload from disk.
+    """
+
+    context_key = hashlib.sha256(full_context_string.encode("utf-8")).hexdigest()[:16]
+    try:
+        get_redis_client().setex(
+            f"universe_context:{context_key}",
+            _UNIVERSE_CONTEXT_TTL_SECONDS,
+            full_context_string,
+        )
+    except Exception:  # pragma: no cover - network/redis dependent
+        return None
+    return context_key
+
+
+def _fetch_shared_universe_context(context_key: str) -> str | None:
+    """Return the context stored by :func:`_share_universe_context`, if any."""
+
+    try:
+        cached = get_redis_client().get(f"universe_context:{context_key}")
+    except Exception:  # pragma: no cover - network/redis dependent
+        return None
+    return cached or None
+
+
+def _histogram_diff(old_text: str, new_text: str, path: str) -> str | None:
+    """Return a unified diff computed by ``git diff --histogram``.
+
+    Git's histogram algorithm runs in C and copes with large lore files far
+    better than :mod:`difflib`. ``None`` is returned when git is unavailable or
+    fails, letting callers fall back to :mod:`difflib`.
+    """
+
+    with tempfile.TemporaryDirectory(prefix="elka-diff-") as directory:
+        Path(directory, "old").write_text(old_text, encoding="utf-8")
+        Path(directory, "new").write_text(new_text, encoding="utf-8")
+        try:
+            completed = subprocess.run(
+                [
+                    "git",
+                    "diff",
+                    "--no-index",
+                    "--no-color",
+                    "--no-ext-diff",
+                    "--histogram",
+                    "--",
+                    "old",
+                    "new",
+                ],
+                cwd=directory,
+                capture_output=True,
+                check=False,
+            )
+        except OSError as exc:
+            logger.debug("git diff unavailable for %s: %s", path, exc)
+            return None
+
+    # Exit status 1 means "files differ"; anything else is an error.
+    if completed.returncode not in (0, 1):
+        return None
+    output = completed.stdout.decode("utf-8", errors="replace")
+    hunks_start = output.find("\n@@")
+    if hunks_start < 0:
+        return ""
+    return f"--- a/{path}\n+++ b/{path}\n{output[hunks_start + 1 :]}"
+
+
+def _split_lines_keepends(text: str) -> List[str]:
+    """Split ``text`` on ``\\n`` only, keeping line endings like git does.
+
+    Unlike :meth:`str.splitlines` this does not break on other Unicode line
+    boundaries, and it skips the per-character line-break table lookups.
+    """
+
+    lines = [f"{line}\n" for line in text.split("\n")]
+    lines[-1] = lines[-1][:-1]
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _count_lines(text: str) -> int:
+    return text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+
+
+def _terminate_diff_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield diff ``lines`` ending in a newline, marking missing ones like git."""
+
+    for line in lines:
+        if line.endswith("\n"):
+            yield line
+        else:
+            yield f"{line}\n\\ No newline at end of file\n"
+
+
+def _wants_histogram_diff(file: ChangesetFile, max_file_chars: int) -> bool:
+    """Return whether ``file`` is large enough to be diffed by git."""
+
+    old_text = file.old or ""
+    if not old_text or old_text == file.new:
+        return False
+    if 0 < max_file_chars < len(old_text) + len(file.new):
+        return False
+    return max(old_text.count("\n"), file.new.count("\n")) > _HISTOGRAM_DIFF_MIN_LINES
+
+
+def _render_diff_preview(files: List[ChangesetFile], max_file_chars: int = 0) -> str:
+    """Return unified diffs for ``files``, summarising files too large to diff.
+
+    Diff lines are streamed into a single buffer instead of being joined per
+    file. When ``max_file_chars`` is positive, files whose combined old and new
+    text exceeds it get a whole-file hunk reporting only line counts. Once the
+    preview passes ``_DIFF_PREVIEW_MAX_TOTAL_CHARS`` the remaining files are
+    only counted, which bounds the text kept in memory and in the task result.
+    Large files are diffed by git concurrently on the I/O pool before the
+    preview is assembled in order.
+    """
+
+    histogram_jobs = {
+        index: _IO_EXECUTOR.submit(_histogram_diff, file.old, file.new, file.path)
+        for index, file in enumerate(files)
+        if _wants_histogram_diff(file, max_file_chars)
+    }
+    buffer = io.StringIO()
+    for index, file in enumerate(files):
+        if buffer.tell() > _DIFF_PREVIEW_MAX_TOTAL_CHARS:
+            buffer.write(
+                f"# Diff preview truncated; {len(files) - index} more file(s)"
+                " not shown.\n"
+            )
+            for job in histogram_jobs.values():
+                job.cancel()
+            break
+        old_text = file.old or ""
+        if old_text == file.new:
+            buffer.write(f"# No diff for {file.path}\n")
+            continue
+        size = len(old_text) + len(file.new)
+        if 0 < max_file_chars < size:
+            old_count, new_count = _count_lines(old_text), _count_lines(file.new)
+            buffer.write(
+                f"--- a/{file.path}\n+++ b/{file.path}\n"
+                f"@@ -1,{old_count} +1,{new_count} @@ diff skipped ({size} characters)\n"
+                f"-<{old_count} lines removed>\n+<{new_count} lines added>\n"
+            )
+            continue
+
+        start = buffer.tell()
+        if not old_text:
+            # New files are a single all-added hunk; no need for difflib.
+            new_lines = _split_lines_keepends(file.new)
+            new_range = "1" if len(new_lines) == 1 else f"1,{len(new_lines)}"
+            buffer.write(
+                f"--- a/{file.path}\n+++ b/{file.path}\n@@ -0,0 +{new_range} @@\n"
+            )
+            buffer.writelines(_terminate_diff_lines(f"+{line}" for line in new_lines))
+        else:
+            job = histogram_jobs.get(index)
+            histogram_diff = job.result() if job is not None else None
+            if histogram_diff is not None:
+                buffer.write(histogram_diff)
+            else:
+                buffer.writelines(
+                    _terminate_diff_lines(
+                        difflib.unified_diff(
+                            _split_lines_keepends(old_text),
+                            _split_lines_keepends(file.new),
+                            fromfile=f"a/{file.path}",
+                            tofile=f"b/{file.path}",
+                        )
+                    )
+                )
+        if buffer.tell() == start:
+            buffer.write(f"# No diff for {file.path}\n")
+    return buffer.getvalue().rstrip("\n")
+
+
+def _universe_graph_sources(project_path: Path) -> List[tuple[Path, str]]:
+    """Return ``(path, label)`` pairs for the files read by :func:`load_universe`."""
+
+    sources: List[tuple[Path, str]] = []
+    for directory, pattern in (
+        ("Entities", "**/*.md"),
+        ("Objekty", "*.md"),
+        ("Legendy", "*.md"),
+        ("Canon", "*.md"),
+    ):
+        item_path = project_path / directory
+        if not item_path.is_dir():
+            continue
+        for filepath in sorted(item_path.glob(pattern)):
+            if filepath.is_file():
+                sources.append((filepath, str(filepath.relative_to(project_path))))
+
+    for relative in ("Metadata/Timeline.md", "timeline.md", "timeline.txt"):
+        filepath = project_path / relative
+        if filepath.is_file():
+            sources.append((filepath, relative))
+    return sources
+
+
+def _load_universe_graph(project_path: Path) -> FactGraph:
+    """Return :func:`load_universe` for ``project_path``, cached per revision.
+
+    Saga chapters processed by the same worker reuse the parsed graph until one
+    of the universe files changes. A deep copy is returned because planning may
+    modify the graph.
+    """
+
+    revision = _universe_context_revision(_universe_graph_sources(project_path))
+    cache_key = (str(project_path), revision)
+    graph = _UNIVERSE_GRAPH_CACHE.get(cache_key)
+    if graph is None:
+        graph = load_universe(project_path)
+        _UNIVERSE_GRAPH_CACHE.set(cache_key, graph)
+    else:
+        logger.debug("Using cached universe graph for %s (%s).", project_path, revision)
+    return graph.model_copy(deep=True)
+
+
+def _analyse_story(
+    story_text: str,
+    current_graph: FactGraph,
+    *,
+    writer_ai: BaseAIAdapter,
+    validator_ai: BaseAIAdapter,
+    extraction_model: str | None,
+) -> tuple[FactGraph, List[ConsistencyIssue]]:
+    """Extract the story's fact graph and check it against ``current_graph``.
+
+    Results are cached by story text, universe graph and models, so running a
+    story again (for example applying it after a dry run) skips extraction and
+    validation while the universe is unchanged. Copies are returned because
+    planning may modify the graph.
+    """
+
+    def _digest(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    cache_key = (
+        _digest(story_text),
+        _digest(current_graph.model_dump_json()),
+        f"{type(writer_ai).__name__}:{getattr(writer_ai, 'model', '')}",
+        f"{type(validator_ai).__name__}:{getattr(validator_ai, 'model', '')}",
+        extraction_model or "",
+    )
+    cached = _STORY_ANALYSIS_CACHE.get(cache_key)
+    if cached is None:
+        incoming_graph = extract_fact_graph(
+            story_text, writer_ai, model_key=extraction_model
+        )
+        issues = validate_universe(current_graph, incoming_graph, validator_ai)
+        cached = (incoming_graph, issues)
+        _STORY_ANALYSIS_CACHE.set(cache_key, cached)
+    else:
+        logger.info("Reusing cached fact extraction and validation for story.")
+
+    incoming_graph, issues = cached
+    return incoming_graph.model_copy(deep=True), [
+        issue.model_copy() for issue in issues
+    ]
+
+
+def _resolve_chapter_context(
+    project_path: Path, project_id: int, universe_context_key: str | None
+) -> str:
+    """Return the saga's shared universe context or load it from the project."""
+
+    if universe_context_key:
+        shared = _fetch_shared_universe_context(universe_context_key)
+        if shared is not None:
+            return shared
+    return _load_full_universe_context(project_path, project_id)
+
+
+def _publish_saga_outline(task_db_id: int, outline_data: Dict[str, Any]) -> None:
+    """Store the serialised outline once for every chapter of the saga."""
+
+    try:
+        get_redis_client().setex(
+            f"saga_outline:{task_db_id}",
+            _SAGA_OUTLINE_TTL_SECONDS,
+            json_dumps_compact(outline_data),
+        )
+    except Exception:  # pragma: no cover - network/redis dependent
+        pass
+
+
+def _load_saga_outline(task_db_id: int) -> tuple[Dict[str, Any], str]:
+    """Return the saga outline and its text, falling back to the stored result."""
+
+    try:
+        outline_text = get_redis_client().get(f"saga_outline:{task_db_id}")
+    except Exception:  # pragma: no cover - network/redis dependent
+        outline_text = None
+    if outline_text:
+        return json_loads(outline_text), outline_text
+
+    outline_data = _get_task_result(task_db_id).get("saga_outline")
+    if not isinstance(outline_data, dict):
+        raise ValueError(f"Saga task {task_db_id} has no stored outline")
+    return outline_data, json_dumps_compact(outline_data)
+
+
 def _persist_context_token_count(project_id: int, token_count: int) -> None:
     if token_count < 0:
         token_count = 0
@@ -337,9 +1141,9 @@ def uce_process_story_task(
     running multiple Git operations in parallel.
     """
 
-    from app.services.task_manager import TaskManager
+    from app.services.task_manager import get_task_manager
 
-    manager = TaskManager()
+    manager = get_task_manager()
     celery_task_id = self.request.id
     _ = parent_task_id
 
@@ -432,8 +1236,7 @@ def uce_process_story_task(
         remaining_story_filenames = new_remaining_list
 
     try:
-        project = app_context.git_manager.get_project_from_db(project_id)
-        project_path = app_context.git_manager.resolve_project_path(project)
+        project, project_path = _get_project(project_id)
 
         story_text = (story_text or "").strip()
 
@@ -468,20 +1271,24 @@ def uce_process_story_task(
         validator_ai, writer_ai = get_ai_adapters(
             app_context.config, project_id=project_id
         )
-        incoming_graph = extract_fact_graph(
+        current_graph = _load_universe_graph(project_path)
+        incoming_graph, issues = _analyse_story(
             story_text,
-            writer_ai,
-            model_key=models.get("extraction"),
+            current_graph,
+            writer_ai=writer_ai,
+            validator_ai=validator_ai,
+            extraction_model=models.get("extraction"),
         )
-        current_graph = load_universe(project_path)
-        issues = validate_universe(current_graph, incoming_graph, validator_ai)
 
-        for issue in issues:
+        if issues:
             manager.update_task_status(
                 celery_task_id,
                 TaskStatus.RUNNING,
                 progress=35,
-                log_message=f"UCE {issue.level.upper()} {issue.code}: {issue.message}",
+                log_message="\n".join(
+                    f"UCE {issue.level.upper()} {issue.code}: {issue.message}"
+                    for issue in issues
+                ),
             )
 
         blocking_codes = {"entity_type_conflict"}
@@ -502,13 +1309,14 @@ def uce_process_story_task(
                 issue.code,
                 issue.message,
             )
+        if non_blocking_errors:
             manager.update_task_status(
                 celery_task_id,
                 TaskStatus.RUNNING,
                 progress=38,
-                log_message=(
-                    "UCE WARNING (non-blocking error) "
-                    f"{issue.code}: {issue.message}"
+                log_message="\n".join(
+                    f"UCE WARNING (non-blocking error) {issue.code}: {issue.message}"
+                    for issue in non_blocking_errors
                 ),
             )
 
@@ -551,21 +1359,9 @@ def uce_process_story_task(
             if not use_snippet_chaining:
                 return
 
-        diff_preview = []
-        for file in changeset.files:
-            old_lines = (file.old or "").splitlines(keepends=True)
-            new_lines = file.new.splitlines(keepends=True)
-            diff = "".join(
-                difflib.unified_diff(
-                    old_lines,
-                    new_lines,
-                    fromfile=f"a/{file.path}",
-                    tofile=f"b/{file.path}",
-                    lineterm="",
-                )
-            )
-            diff_preview.append(diff or f"# No diff for {file.path}")
-        diff_preview_text = "\n".join(diff_preview)
+        diff_preview_text = _render_diff_preview(
+            changeset.files, app_context.config.max_diff_chars()
+        )
 
         if not apply:
             result_data = {
@@ -654,7 +1450,7 @@ def uce_process_story_task(
             logger.info(f"Task {celery_task_id}: Finished processing chain.")
         # --- KONEC KÓDU PRO ŘETĚZENÍ ---
     except Exception as exc:  # pragma: no cover - defensive logging
-        if isinstance(exc, Retry):
+        if isinstance(exc, Retry) or self.will_retry(exc):
             raise
         logger.exception("uce_process_story_task failed: %s", exc)
         manager.update_task_status(
@@ -686,9 +1482,9 @@ def generate_story_from_seed_task(
 ) -> dict:
     """Generate a story from a seed and optionally trigger the UCE pipeline."""
 
-    from app.services.task_manager import TaskManager
+    from app.services.task_manager import get_task_manager
 
-    manager = TaskManager()
+    manager = get_task_manager()
     celery_task_id = self.request.id
     tokens = {"input": 0, "output": 0}
 
@@ -719,11 +1515,8 @@ def generate_story_from_seed_task(
             log_message=f"Task {task_db_id}: starting story generation from seed.",
         )
 
-        project = app_context.git_manager.get_project_from_db(project_id)
-        project_path = Path(app_context.git_manager.resolve_project_path(project))
-        models = load_project_ai_models(app_context.config, project_id)
-        validator_ai, writer_ai = get_ai_adapters(
-            app_context.config, project_id=project_id
+        project, project_path, models, (validator_ai, writer_ai) = (
+            _load_project_resources(project_id)
         )
 
         manager.update_task_status(
@@ -762,26 +1555,12 @@ def generate_story_from_seed_task(
                 f"{rewrite_prompt}\n\n---\n\n{seed.strip()}"
             )
         else:
-            prompt_template = """
-**Full Universe Context:**
----
-{full_context_string}
----
-**End of Full Universe Context**
-
-**Instruction:** Based **strictly and solely** on the **Full Universe Context** provided above, continue the story for project '{project_name}'.
-The specific idea to develop is: **'{seed}'**.
-Ensure the generated story is deeply consistent with **all** aspects of the established lore, characters, locations, events, timeline, and writing style found in the context. Output only the new story content in Markdown format. Do not repeat the context.
-
-**Seed idea:** {seed}
-
-**Generated Story:**
-""".strip()
-
-            prompt = prompt_template.format(
-                project_name=project.name,
-                seed=seed.strip(),
-                full_context_string=full_context_string,
+            prompt = _STORY_PROMPT_TEMPLATE.format_map(
+                {
+                    "project_name": project.name,
+                    "seed": seed.strip(),
+                    "full_context_string": full_context_string,
+                }
             )
 
         truncated_prompt = prompt[:500]
@@ -807,7 +1586,7 @@ Ensure the generated story is deeply consistent with **all** aspects of the esta
 
         resolved_title = (
             (story_title or "").strip()
-            or seed.split("\n", maxsplit=1)[0].strip()
+            or seed.partition("\n")[0].strip()
             or "Untitled Story"
         )
         resolved_author = (story_author or "").strip() or "eLKA Author"
@@ -858,7 +1637,7 @@ Ensure the generated story is deeply consistent with **all** aspects of the esta
             "seed": seed,
         }
     except Exception as exc:  # pragma: no cover - defensive logging
-        if isinstance(exc, Retry):
+        if isinstance(exc, Retry) or self.will_retry(exc):
             raise
         logger.exception("generate_story_from_seed_task failed: %s", exc)
         manager.update_task_status(
@@ -909,9 +1688,9 @@ def process_story_task(
 ) -> None:
     """Validate, archive, and commit a story to the project's repository."""
 
-    from app.services.task_manager import TaskManager
+    from app.services.task_manager import get_task_manager
 
-    manager = TaskManager()
+    manager = get_task_manager()
     tokens = {"input": 0, "output": 0}
 
     if isinstance(payload, dict):
@@ -943,11 +1722,8 @@ def process_story_task(
     project_id = project_id_int
 
     try:
-        project = app_context.git_manager.get_project_from_db(project_id)
-        project_path = Path(app_context.git_manager.resolve_project_path(project))
-        models = load_project_ai_models(app_context.config, project_id)
-        validator_ai, writer_ai = get_ai_adapters(
-            app_context.config, project_id=project_id
+        project, project_path, models, (validator_ai, writer_ai) = (
+            _load_project_resources(project_id)
         )
 
         relative_story_path: Path
@@ -964,9 +1740,8 @@ def process_story_task(
                 story_title or "Untitled Story"
             ).strip() or "Untitled Story"
             sanitized = sanitize_filename(fallback_title, default="story")
-            timestamped_name = (
-                f"{sanitized}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.md"
-            )
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+            timestamped_name = f"{sanitized}-{timestamp}.md"
             if saga_theme:
                 saga_slug = _slugify(str(saga_theme)) or "saga"
                 relative_story_path = Path("stories") / saga_slug / timestamped_name
@@ -1000,12 +1775,14 @@ def process_story_task(
             universe_context=universe_context,
         )
 
-        for step in validation_report.steps:
+        if validation_report.steps:
             manager.update_task_status_by_db_id(
                 task_db_id,
                 TaskStatus.RUNNING,
                 progress=65,
-                log_message=step.summary(),
+                log_message="\n".join(
+                    step.summary() for step in validation_report.steps
+                ),
             )
 
         if not validation_report.passed:
@@ -1040,35 +1817,33 @@ def process_story_task(
             task_id=task_db_id,
             saga_theme=saga_theme,
         )
-        files_to_commit: dict[str, str] = dict(archive_result.files)
-
-        if story_title and "title" not in archive_result.metadata:
-            archive_result.metadata["title"] = story_title
-        if story_author and "author" not in archive_result.metadata:
-            archive_result.metadata["author"] = story_author
-
-        for message in archive_result.log_messages:
-            manager.update_task_status_by_db_id(
-                task_db_id,
-                TaskStatus.RUNNING,
-                progress=80,
-                log_message=message,
-            )
-
-        if not files_to_commit:
+        archive_log = "\n".join(archive_result.log_messages)
+        if not archive_result.files:
             manager.update_task_status_by_db_id(
                 task_db_id,
                 TaskStatus.FAILURE,
                 progress=82,
-                log_message="Archival produced no files to commit.",
+                log_message="\n".join(
+                    filter(None, [archive_log, "Archival produced no files to commit."])
+                ),
             )
             return
 
+        # Status updates deep-copy their result payloads, so no defensive copy.
+        files_to_commit: dict[str, str] = archive_result.files
+
+        if story_title and "title" not in archive_result.metadata:
+            archive_result.metadata["title"] = story_title
+        if story_author and "author" not in archive_result.metadata:
+            archive_result.metadata["author"] = story_author
+
         manager.update_task_status_by_db_id(
             task_db_id,
             TaskStatus.RUNNING,
             progress=85,
-            log_message="Prepared files for commit.",
+            log_message="\n".join(
+                filter(None, [archive_log, "Prepared files for commit."])
+            ),
             result={
                 "files": files_to_commit,
                 "metadata": archive_result.metadata,
@@ -1100,7 +1875,7 @@ def process_story_task(
             result=result_payload,
         )
     except Exception as exc:  # pragma: no cover - defensive logging
-        if isinstance(exc, Retry):
+        if isinstance(exc, Retry) or self.will_retry(exc):
             raise
         logger.exception("process_story_task failed: %s", exc)
         manager.update_task_status_by_db_id(
@@ -1124,7 +1899,7 @@ def generate_chapter_task(
     project_id: int,
     chapter_index: int,
     total_chapters: int,
-    saga_outline: Dict[str, Any] | str,
+    saga_outline: Dict[str, Any] | str | None = None,
     chapter_plan: Dict[str, Any] | None = None,
     story_title: str | None = None,
     story_author: str | None = None,
@@ -1132,54 +1907,81 @@ def generate_chapter_task(
     pr_id: int | None = None,
     saga_theme: str | None = None,
     parent_task_id: int | None = None,
+    universe_context_key: str | None = None,
+    previous_chapter_task_id: int | None = None,
+    outline_text: str | None = None,
+    generated_at: str | None = None,
 ) -> Dict[str, Any]:
-    """Generate a single saga chapter and archive it in the repository."""
+    """Generate a single saga chapter and archive it in the repository.
+
+    Saga chapters run as links of a Celery chain; ``previous_chapter_task_id``
+    points at the preceding link whose stored result provides the previous
+    chapter content. When ``saga_outline`` is omitted the outline published by
+    the parent saga is loaded (see :func:`_load_saga_outline`) and the chapter
+    plan is taken from it by ``chapter_index``.
+    """
 
-    from app.services.task_manager import TaskManager
+    from app.services.task_manager import get_task_manager
 
-    manager = TaskManager()
+    manager = get_task_manager()
     celery_task_id = self.request.id
+    status_updates = manager.status_buffer(celery_task_id)
     tokens = {"input": 0, "output": 0}
-    _ = parent_task_id
 
     try:
-        manager.update_task_status(
-            celery_task_id,
-            TaskStatus.RUNNING,
+        if parent_task_id is not None:
+            # Blocks this worker slot while the saga stays paused.
+            _wait_while_paused(parent_task_id)
+            manager.update_task_status_by_db_id(
+                parent_task_id,
+                TaskStatus.RUNNING,
+                progress=45 + int(40 * (chapter_index - 1) / max(total_chapters, 1)),
+                log_message=(
+                    f"Starting generation for chapter {chapter_index}/{total_chapters}."
+                ),
+                keep_paused=True,
+            )
+
+        if previous_chapter_content is None and previous_chapter_task_id is not None:
+            previous_chapter_content = _get_task_result(previous_chapter_task_id).get(
+                "content"
+            )
+
+        status_updates.log(
+            f"Task {task_db_id}: generating chapter {chapter_index}/{total_chapters}.",
             progress=5,
-            log_message=(
-                f"Task {task_db_id}: generating chapter {chapter_index}/{total_chapters}."
-            ),
         )
 
-        project = app_context.git_manager.get_project_from_db(project_id)
-        project_path = Path(app_context.git_manager.resolve_project_path(project))
-        models = load_project_ai_models(app_context.config, project_id)
-        _, writer_ai = get_ai_adapters(app_context.config, project_id=project_id)
+        project, project_path, models, (validator_ai, writer_ai) = (
+            _load_project_resources(project_id)
+        )
 
-        manager.update_task_status(
-            celery_task_id,
-            TaskStatus.RUNNING,
+        status_updates.log(
+            "Loading universe context for chapter generation...",
             progress=15,
-            log_message="Loading universe context for chapter generation...",
         )
 
-        full_context_string = _load_full_universe_context(project_path, project_id)
+        full_context_string = _resolve_chapter_context(
+            project_path, project_id, universe_context_key
+        )
 
-        manager.update_task_status(
-            celery_task_id,
-            TaskStatus.RUNNING,
+        status_updates.log(
+            "Using writer model '%s' for chapter generation."
+            % models.get("generation"),
             progress=30,
-            log_message=(
-                "Using writer model '%s' for chapter generation."
-                % models.get("generation")
-            ),
         )
 
-        if isinstance(saga_outline, dict):
+        if saga_outline is None and parent_task_id is not None:
+            outline_data, outline_text = _load_saga_outline(parent_task_id)
+        elif isinstance(saga_outline, dict):
             outline_data = saga_outline
         else:
-            outline_data = _extract_json_payload(str(saga_outline))
+            outline_data = _extract_json_payload(str(saga_outline or ""))
+
+        planned_chapters = outline_data.get("chapters")
+        if chapter_plan is None and isinstance(planned_chapters, list):
+            if 0 < chapter_index <= len(planned_chapters):
+                chapter_plan = planned_chapters[chapter_index - 1]
 
         chapter_plan_data = chapter_plan if isinstance(chapter_plan, dict) else None
         saga_title = (
@@ -1189,71 +1991,73 @@ def generate_chapter_task(
         )
         resolved_author = (story_author or "").strip() or "eLKA Author"
 
-        outline_text = json.dumps(outline_data, ensure_ascii=False, indent=2)
+        # LLMs parse compact JSON fine; indent=2 inflated prompt size by ~30%.
+        if outline_text is None:
+            outline_text = json_dumps_compact(outline_data)
         chapter_plan_text = (
-            json.dumps(chapter_plan_data, ensure_ascii=False, indent=2)
-            if chapter_plan_data
-            else "No detailed chapter plan provided."
+            json_dumps_compact(chapter_plan_data) if chapter_plan_data else None
         )
 
-        prompt_sections: List[str] = [
-            "You are an expert saga author continuing a multi-chapter narrative.",
-            "",
-            "## Universe Context",
+        prompt_context = _select_relevant_context(
             full_context_string,
-            "",
-            "## Saga Outline",
-            outline_text,
-        ]
-
-        if chapter_plan_data:
-            prompt_sections.extend(
-                [
-                    "",
-                    f"## Chapter {chapter_index} Plan",
-                    chapter_plan_text,
-                ]
-            )
-
-        if previous_chapter_content:
-            prompt_sections.extend(
-                [
-                    "",
-                    "## Previous Chapter Content",
-                    previous_chapter_content.strip(),
-                ]
+            " ".join(filter(None, [saga_theme, chapter_plan_text])),
+            app_context.config.context_token_budget(),
+        )
+        prompt = "\n".join(
+            _iter_chapter_prompt_sections(
+                full_context_string=prompt_context,
+                outline_text=outline_text,
+                chapter_index=chapter_index,
+                total_chapters=total_chapters,
+                chapter_plan_text=chapter_plan_text,
+                previous_chapter_content=previous_chapter_content,
             )
-
-        prompt_sections.extend(
-            [
-                "",
-                dedent(
-                    f"""
-                    ## Writing Instructions
-                    - Write only the full prose for Chapter {chapter_index} of {total_chapters}.
-                    - Maintain continuity with earlier chapters and foreshadow future beats only when supported by the outline.
-                    - Use expressive Markdown prose suitable for publication.
-                    - Do not include commentary about other chapters or meta analysis.
-                    - Return only the chapter content in Markdown format.
-                    """
-                ).strip(),
-            ]
         )
+        # Only the prompt is needed while waiting on the model; the context is
+        # resolved again for archiving rather than pinned through the LLM call.
+        del full_context_string, prompt_context, previous_chapter_content
 
-        prompt = "\n".join(prompt_sections)
-
-        manager.update_task_status(
-            celery_task_id,
-            TaskStatus.RUNNING,
+        status_updates.log(
+            "Requesting chapter content from AI adapter...",
             progress=45,
-            log_message="Requesting chapter content from AI adapter...",
         )
+        status_updates.flush()
 
-        generated_text, usage_metadata = writer_ai.generate_text(
-            prompt,
-            model_key=models.get("generation"),
+        cascade = app_context.config.get_cascade_for_task(
+            "generate_chapter", models.get("generation")
         )
-        usage_increment = _accumulate_usage(usage_metadata, tokens)
+        usage_increment = {"input": 0, "output": 0}
+        for tier_index, (tier_model, threshold) in enumerate(cascade, start=1):
+            generated_text, usage_metadata = _stream_chapter_text(
+                manager,
+                celery_task_id,
+                writer_ai,
+                prompt,
+                model_key=tier_model,
+            )
+            _accumulate_usage(usage_metadata, usage_increment)
+            if tier_index == len(cascade):
+                break
+
+            # The validator adapter is built for the validation model.
+            score, verifier_usage = _score_chapter_draft(
+                validator_ai,
+                generated_text,
+                chapter_index=chapter_index,
+                chapter_plan_text=chapter_plan_text or outline_text,
+            )
+            _accumulate_usage(verifier_usage, usage_increment)
+            if score >= threshold:
+                break
+            status_updates.log(
+                f"Draft from '{tier_model}' scored {score:.2f} (< {threshold:.2f});"
+                " escalating to the next model."
+            )
+            status_updates.flush()
+
+        del prompt
+        tokens["input"] += usage_increment["input"]
+        tokens["output"] += usage_increment["output"]
         generated_body = generated_text.strip()
 
         manager.update_task_field(
@@ -1275,6 +2079,7 @@ def generate_chapter_task(
             author=resolved_author,
             generated_body=generated_body,
             story_directory=story_directory,
+            generated_at=generated_at,
         )
 
         git_adapter = app_context.create_git_adapter(project)
@@ -1285,17 +2090,18 @@ def generate_chapter_task(
             model_overrides=models,
         )
 
-        manager.update_task_status(
-            celery_task_id,
-            TaskStatus.RUNNING,
+        status_updates.log(
+            "Archiving generated chapter and updating lore metadata...",
             progress=65,
-            log_message="Archiving generated chapter and updating lore metadata...",
         )
+        status_updates.flush()
 
         archive_result = archivist.archive(
             document,
             story_file_path=project_path / relative_path,
-            universe_context=full_context_string,
+            universe_context=_resolve_chapter_context(
+                project_path, project_id, universe_context_key
+            ),
             task_id=task_db_id,
             saga_theme=saga_theme,
         )
@@ -1329,22 +2135,52 @@ def generate_chapter_task(
             output_tokens=usage_increment["output"],
         )
 
+        if parent_task_id is not None:
+            # Re-read the parent so a pause requested meanwhile is kept.
+            manager.update_task_status_by_db_id(
+                parent_task_id,
+                _get_current_status(parent_task_id) or TaskStatus.RUNNING,
+                progress=45 + int(40 * chapter_index / max(total_chapters, 1)),
+                log_message=(
+                    f"Chapter {chapter_index}/{total_chapters} completed via task {task_db_id}."
+                ),
+            )
+
         return result_payload
     except Exception as exc:  # pragma: no cover - defensive logging
-        if isinstance(exc, Retry):
+        if isinstance(exc, Retry) or self.will_retry(exc):
             raise
         logger.exception("generate_chapter_task failed: %s", exc)
+        status_updates.flush()
         manager.update_task_status(
             celery_task_id,
             TaskStatus.FAILURE,
             log_message=f"Task {task_db_id} failed: {exc}",
         )
+        if parent_task_id is not None:
+            manager.update_task_status_by_db_id(
+                parent_task_id,
+                TaskStatus.FAILURE,
+                log_message=(
+                    f"Chapter {chapter_index} generation failed: {exc}. See child task {task_db_id}."
+                ),
+                result={"failed_chapter": chapter_index},
+            )
+            # The chain stops here, so the later chapters would stay queued.
+            manager.fail_pending_tasks(
+                _pending_child_task_ids(parent_task_id),
+                f"Saga task {parent_task_id} stopped after chapter {chapter_index} failed.",
+            )
         raise
     finally:
         self.update_db_task_tokens(tokens["input"], tokens["output"])
 
 
-@celery_app.task(bind=True, name="app.tasks.lore_tasks.generate_saga_task")
+@celery_app.task(
+    bind=True,
+    base=BaseTask,
+    name="app.tasks.lore_tasks.generate_saga_task",
+)
 def generate_saga_task(
     self,
     task_db_id: int,
@@ -1356,80 +2192,53 @@ def generate_saga_task(
     story_author: str | None = None,
     parent_task_id: int | None = None,
 ) -> None:
-    """Plan a saga and sequentially generate each chapter."""
+    """Plan a saga and enqueue its chapters as a sequential Celery chain."""
 
     if chapters < 1:
         raise ValueError("Saga must contain at least one chapter.")
 
-    from app.services.task_manager import TaskManager
+    from app.services.task_manager import get_task_manager
 
-    manager = TaskManager()
+    manager = get_task_manager()
     celery_task_id = self.request.id
-    models = manager.get_project_ai_models(project_id)
-    validator_ai, writer_ai = get_ai_adapters(
-        app_context.config,
-        project_id=project_id,
-    )
+    status_updates = manager.status_buffer(celery_task_id)
     tokens = {"input": 0, "output": 0}
+    chapter_task_ids: List[int] = []
     _ = parent_task_id
 
-    manager.update_task_status(
-        celery_task_id,
-        TaskStatus.RUNNING,
+    status_updates.log(
+        f"Task {task_db_id}: planning a {chapters}-part saga for theme '{theme}'.",
         progress=5,
-        log_message=(
-            f"Task {task_db_id}: planning a {chapters}-part saga for theme '{theme}'."
-        ),
     )
 
     try:
-        project = app_context.git_manager.get_project_from_db(project_id)
-        project_path = Path(app_context.git_manager.resolve_project_path(project))
+        project, project_path, models, (_, writer_ai) = _load_project_resources(
+            project_id
+        )
 
-        manager.update_task_status(
-            celery_task_id,
-            TaskStatus.RUNNING,
+        status_updates.log(
+            "Gathering universe context for saga planning...",
             progress=15,
-            log_message="Gathering universe context for saga planning...",
         )
 
         full_context_string = _load_full_universe_context(project_path, project_id)
 
-        manager.update_task_status(
-            celery_task_id,
-            TaskStatus.RUNNING,
+        status_updates.log(
+            "Generating saga outline with planning model '%s'."
+            % models.get("planning"),
             progress=25,
-            log_message=(
-                "Generating saga outline with planning model '%s'."
-                % models.get("planning")
-            ),
         )
 
-        planning_prompt = dedent(
-            f"""
-            You are designing an epic saga set within the established universe context.
-
-            ## Universe Context
-            {full_context_string}
-
-            Craft a cohesive saga inspired by the theme "{theme}" that spans exactly {chapters} chapters.
-            Respond strictly in JSON with the following structure:
-            {{
-              "saga_title": "...",
-              "logline": "...",
-              "chapters": [
-                {{
-                  "index": 1,
-                  "title": "...",
-                  "summary": "...",
-                  "key_events": ["...", "..."]
-                }}
-              ]
-            }}
-
-            Each chapter summary must reference previous developments to maintain continuity.
-            """
-        ).strip()
+        planning_prompt = _SAGA_PLANNING_PROMPT.format(
+            full_context_string=_select_relevant_context(
+                full_context_string,
+                theme,
+                app_context.config.context_token_budget(),
+            ),
+            theme=theme,
+            chapters=chapters,
+        )
+        status_updates.flush()
 
         planner_response, usage_metadata = writer_ai.generate_text(
             planning_prompt,
@@ -1459,11 +2268,9 @@ def generate_saga_task(
                 chapters,
             )
 
-        manager.update_task_status(
-            celery_task_id,
-            TaskStatus.RUNNING,
+        status_updates.log(
+            f"Saga outline prepared with {total_chapters} chapter(s).",
             progress=45,
-            log_message=f"Saga outline prepared with {total_chapters} chapter(s).",
             result={
                 "saga_outline": outline_data,
                 "planner_raw": planner_response,
@@ -1471,6 +2278,7 @@ def generate_saga_task(
             input_tokens=planning_increment["input"],
             output_tokens=planning_increment["output"],
         )
+        status_updates.flush()
 
         saga_title_resolved = (
             (story_title or "").strip()
@@ -1478,147 +2286,67 @@ def generate_saga_task(
             or project.name
         )
         saga_author_resolved = (story_author or "").strip() or "eLKA Author"
+        _publish_saga_outline(task_db_id, outline_data)
+        universe_context_key = _share_universe_context(full_context_string)
 
-        previous_content: Optional[str] = None
-        chapter_results: List[Dict[str, Any]] = []
-        story_filenames: List[str] = []
-
-        for index, chapter_plan in enumerate(chapters_data, start=1):
-            _wait_while_paused(task_db_id)
-            if _get_current_status(task_db_id) == TaskStatus.PAUSED:
-                logger.info("Saga task %s paused before chapter %s.", task_db_id, index)
-                break
-
-            manager.update_task_status(
-                celery_task_id,
-                TaskStatus.RUNNING,
-                progress=45 + int(40 * index / max(total_chapters, 1)),
-                log_message=f"Starting generation for chapter {index}/{total_chapters}.",
-            )
-
+        saga_generated_at = _utc_timestamp()
+        chapter_params: List[Dict[str, Any]] = []
+        for index in range(1, total_chapters + 1):
             params = {
                 "project_id": project.id,
                 "chapter_index": index,
                 "total_chapters": total_chapters,
-                "saga_outline": outline_data,
-                "chapter_plan": chapter_plan,
                 "story_title": saga_title_resolved,
                 "story_author": saga_author_resolved,
-                "previous_chapter_content": previous_content,
                 "saga_theme": theme,
+                "generated_at": saga_generated_at,
             }
             if pr_id is not None:
                 params["pr_id"] = pr_id
+            if universe_context_key:
+                params["universe_context_key"] = universe_context_key
             params["parent_task_id"] = task_db_id
+            chapter_params.append(params)
+
+        chapter_jobs = manager.create_task_signatures(
+            project_id=project.id,
+            task_type=TaskType.GENERATE_CHAPTER.value,
+            params_list=chapter_params,
+            parent_task_id=task_db_id,
+            previous_task_param="previous_chapter_task_id",
+        )
+        chapter_signatures = [signature for _, signature in chapter_jobs]
+        chapter_task_ids = [chapter_task.id for chapter_task, _ in chapter_jobs]
 
-            chapter_task = manager.create_task(
+        workflow = chain(
+            *chapter_signatures,
+            finalize_saga_task.si(
+                task_db_id,
                 project_id=project.id,
-                task_type=TaskType.GENERATE_CHAPTER.value,
-                params=params,
-                parent_task_id=task_db_id,
-            )
-
-            try:
-                async_result = AsyncResult(chapter_task.celery_task_id)
-                chapter_payload = async_result.get(disable_sync_subtasks=False)
-            except Exception as exc:
-                logger.exception(
-                    "Chapter %s generation failed for saga task %s: %s",
-                    index,
-                    task_db_id,
-                    exc,
-                )
-                manager.update_task_status(
-                    celery_task_id,
-                    TaskStatus.FAILURE,
-                    log_message=(
-                        f"Chapter {index} generation failed: {exc}. See child task {chapter_task.id}."
-                    ),
-                    result={
-                        "saga_outline": outline_data,
-                        "failed_chapter": index,
-                        "chapters": chapter_results,
-                    },
-                )
-                raise
-
-            previous_content = chapter_payload.get("content")
-            chapter_metadata = chapter_payload.get("metadata") or {}
-            relative_path = chapter_metadata.get("relative_path")
-            if isinstance(relative_path, str) and relative_path:
-                story_filenames.append(relative_path)
-            chapter_results.append(
-                {
-                    "task_id": chapter_task.id,
-                    "chapter_index": index,
-                    "title": chapter_payload.get("title")
-                    or str(chapter_plan.get("title", f"Chapter {index}")),
-                    "approval_required": True,
-                    "commit_message": chapter_payload.get("commit_message"),
-                }
-            )
-
-            manager.update_task_status(
-                celery_task_id,
-                TaskStatus.RUNNING,
-                log_message=(
-                    f"Chapter {index}/{total_chapters} completed via task {chapter_task.id}."
-                ),
-                result={"chapters": chapter_results},
-            )
-
-        if _get_current_status(task_db_id) == TaskStatus.PAUSED:
-            logger.info("Saga task %s paused after chapter loop.", task_db_id)
-            return
-
-        final_result = {
-            "saga_outline": outline_data,
-            "chapters": chapter_results,
-            "saga_theme": theme,
-            "story_files": story_filenames,
-        }
-        manager.update_task_status(
-            celery_task_id,
-            TaskStatus.SUCCESS,
-            progress=100,
-            log_message=(
-                "Saga generation completed. Review chapter tasks and approve to"
-                f" publish changes to {manager.config.default_branch}."
+                chapter_task_ids=chapter_task_ids,
+                theme=theme,
             ),
-            result=final_result,
         )
-
-        if story_filenames:
-            first_story = story_filenames[0]
-            remaining_stories = story_filenames[1:]
-            manager.update_task_status(
-                celery_task_id,
-                TaskStatus.SUCCESS,
-                log_message=(
-                    "Starting sequential Universe Consistency Engine processing for"
-                    f" generated chapters beginning with '{first_story}'."
-                ),
-                result={"story_files": story_filenames},
-            )
-            uce_process_story_task.apply_async(
-                args=[task_db_id],
-                kwargs={
-                    "project_id": project.id,
-                    "story_text": None,
-                    "apply": True,
-                    "story_file_path": first_story,
-                    "saga_theme": theme,
-                    "remaining_story_filenames": remaining_stories,
-                    "parent_task_id": task_db_id,
-                },
-            )
+        status_updates.log(
+            f"Queued {total_chapters} chapter task(s); chapters are generated"
+            " sequentially."
+        )
+        status_updates.flush()
+        workflow.apply_async()
     except Exception as exc:  # pragma: no cover - defensive logging
-        if isinstance(exc, Retry):
+        if not chapter_task_ids and (isinstance(exc, Retry) or self.will_retry(exc)):
             raise
         logger.exception("generate_saga_task failed: %s", exc)
+        # Chapter rows already exist: a retry would plan the saga again and
+        # insert a second set, so fail the unscheduled ones instead.
+        manager.fail_pending_tasks(
+            chapter_task_ids,
+            f"Saga task {task_db_id} failed before this chapter was queued.",
+        )
         input_tokens = tokens.get("input") if isinstance(tokens, dict) else None
         output_tokens = tokens.get("output") if isinstance(tokens, dict) else None
 
+        status_updates.flush()
         manager.update_task_status(
             celery_task_id,
             TaskStatus.FAILURE,
@@ -1626,13 +2354,93 @@ def generate_saga_task(
             input_tokens=input_tokens,
             output_tokens=output_tokens,
         )
+        if chapter_task_ids:
+            # Re-raise as a non-retryable error so autoretry stays out of it.
+            raise RuntimeError(f"Saga {task_db_id} failed: {exc}") from exc
         raise
 
 
+@celery_app.task(bind=True, name="app.tasks.lore_tasks.finalize_saga_task")
+def finalize_saga_task(
+    self,
+    task_db_id: int,
+    project_id: int,
+    chapter_task_ids: List[int],
+    theme: str | None = None,
+) -> Dict[str, Any]:
+    """Aggregate chapter results once the final link of a saga chain finishes."""
+
+    from app.services.task_manager import get_task_manager
+
+    manager = get_task_manager()
+    _wait_while_paused(task_db_id)
+
+    chapter_results: List[Dict[str, Any]] = []
+    story_filenames: List[str] = []
+    stored_results = _get_task_results([task_db_id, *chapter_task_ids])
+    for index, chapter_task_id in enumerate(chapter_task_ids, start=1):
+        chapter_payload = stored_results.get(chapter_task_id, {})
+        chapter_metadata = chapter_payload.get("metadata") or {}
+        relative_path = chapter_metadata.get("relative_path")
+        if isinstance(relative_path, str) and relative_path:
+            story_filenames.append(relative_path)
+        chapter_results.append(
+            {
+                "task_id": chapter_task_id,
+                "chapter_index": index,
+                "title": chapter_payload.get("title") or f"Chapter {index}",
+                "approval_required": True,
+                "commit_message": chapter_payload.get("commit_message"),
+            }
+        )
+
+    final_result = {
+        "saga_outline": stored_results.get(task_db_id, {}).get("saga_outline"),
+        "chapters": chapter_results,
+        "saga_theme": theme,
+        "story_files": story_filenames,
+    }
+    log_message = (
+        "Saga generation completed. Review chapter tasks and approve to"
+        f" publish changes to {manager.config.default_branch}."
+    )
+    if story_filenames:
+        log_message += (
+            "\nStarting sequential Universe Consistency Engine processing for"
+            f" generated chapters beginning with '{story_filenames[0]}'."
+        )
+    manager.update_task_status_by_db_id(
+        task_db_id,
+        TaskStatus.SUCCESS,
+        progress=100,
+        log_message=log_message,
+        result=final_result,
+    )
+
+    if story_filenames:
+        first_story = story_filenames[0]
+        remaining_stories = story_filenames[1:]
+        uce_process_story_task.apply_async(
+            args=[task_db_id],
+            kwargs={
+                "project_id": project_id,
+                "story_text": None,
+                "apply": True,
+                "story_file_path": first_story,
+                "saga_theme": theme,
+                "remaining_story_filenames": remaining_stories,
+                "parent_task_id": task_db_id,
+            },
+        )
+
+    return final_result
+
+
 __all__ = [
     "uce_process_story_task",
     "generate_story_from_seed_task",
     "process_story_task",
     "generate_chapter_task",
     "generate_saga_task",
+    "finalize_saga_task",
 ]
@@ -1,7 +1,18 @@
 """Utility helpers for eLKA Studio."""
 
+from .cache import BoundedCache
 from .config import Config
-from .filesystem import sanitize_filename
+from .filesystem import sanitize_filename, write_text_if_changed
 from .identifiers import generate_entity_id
+from .serialization import json_dumps_compact, json_dumps_pretty, json_loads
 
-__all__ = ["Config", "sanitize_filename", "generate_entity_id"]
+__all__ = [
+    "BoundedCache",
+    "Config",
+    "sanitize_filename",
+    "generate_entity_id",
+    "json_dumps_compact",
+    "json_dumps_pretty",
+    "json_loads",
+    "write_text_if_changed",
+]
@@ -0,0 +1,72 @@
+"""In-process caching helpers shared by the API and Celery workers."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BoundedCache(Generic[K, V]):
+    """Thread-safe LRU mapping with an optional per-entry time-to-live.
+
+    Entries beyond ``maxsize`` are evicted in least-recently-used order. When
+    ``ttl`` is provided, entries older than ``ttl`` seconds are treated as
+    missing and dropped on access.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the cached value for ``key`` or ``default`` when absent."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            stored_at, value = entry
+            if self._ttl is not None and time.monotonic() - stored_at > self._ttl:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store ``value`` under ``key`` and evict the oldest entries if needed."""
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        """Remove ``key`` from the cache and return its value if present."""
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+__all__ = ["BoundedCache"]
@@ -12,22 +12,49 @@ from __future__ import annotations
 
 import logging
 import os
+import time
+from copy import deepcopy
 from dataclasses import dataclass, field
-from datetime import datetime
+from functools import lru_cache
+from datetime import datetime, timezone
 from pathlib import Path
+from threading import Lock
 from typing import Any, Dict, Optional
 
 import yaml
 
 from app.utils.filesystem import sanitize_filename
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+# Parsed config.yml keyed by (path, st_mtime_ns, st_size); only the latest
+# revision is kept.
+_CONFIG_CACHE: Dict[tuple[str, int, int], Dict[str, Any]] = {}
+_CONFIG_CACHE_LOCK = Lock()
+
 
 def find_config_file() -> Optional[Path]:
     """Return the first configuration file discovered for the application."""
-    env_path = os.getenv("ELKA_CONFIG_PATH")
+    return _find_config_file(os.getenv("ELKA_CONFIG_PATH"))
+
+
+@lru_cache(maxsize=4)
+def _find_config_file(env_path: Optional[str]) -> Optional[Path]:
+    """Resolve the configuration file for a given ``ELKA_CONFIG_PATH`` value.
+
+    Results are cached per value for the lifetime of the process, like the
+    other settings that require a restart to change; see
+    :func:`clear_config_cache`.
+    """
+
     if env_path:
         candidate = Path(env_path).expanduser()
         if candidate.is_file():
@@ -44,16 +71,52 @@ def find_config_file() -> Optional[Path]:
     return None
 
 
+def clear_config_cache() -> None:
+    """Forget the discovered config file location and the parsed mapping."""
+
+    _find_config_file.cache_clear()
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
+
 def load_config() -> Dict[str, Any]:
-    """Load the application configuration from disk if available."""
+    """Load the application configuration from disk if available.
+
+    The parsed mapping is cached until the file's modification time or size
+    changes, so edits made through the settings API are picked up. Callers
+    receive a copy and may modify it freely.
+    """
     config_file = find_config_file()
     if not config_file:
         return {}
 
-    with config_file.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+    try:
+        stat_result = config_file.stat()
+    except OSError:
+        return {}
+    cache_key = (str(config_file), stat_result.st_mtime_ns, stat_result.st_size)
+
+    with _CONFIG_CACHE_LOCK:
+        data = _CONFIG_CACHE.get(cache_key)
+        if data is None:
+            with config_file.open("r", encoding="utf-8") as handle:
+                data = yaml.load(handle, Loader=_YamlLoader) or {}
+            _CONFIG_CACHE.clear()
+            _CONFIG_CACHE[cache_key] = data
+
+    return deepcopy(data)
 
-    return data
+
+@lru_cache(maxsize=16)
+def _validated_timestamp_format(fmt: str) -> str:
+    """Return ``fmt`` if ``strftime`` accepts it, otherwise the default format."""
+
+    try:
+        # Validate the format string by performing a dry run.
+        datetime.now(timezone.utc).strftime(fmt)
+    except ValueError:  # pragma: no cover - defensive branch
+        return _DEFAULT_TIMESTAMP_FORMAT
+    return fmt
 
 
 @dataclass(slots=True)
@@ -64,9 +127,41 @@ class Config:
     convenience properties with sensible defaults. This allows Celery workers
     and other background services to share the same configuration handling as
     the FastAPI application without duplicating parsing logic.
+
+    Values derived only from ``data`` are resolved once at construction.
+    Accessors that honour environment overrides read the environment on every
+    call, so changes take effect without rebuilding the shared instance.
     """
 
     data: Dict[str, Any] = field(default_factory=load_config)
+    _projects_dir: Path = field(init=False, repr=False, compare=False)
+    _default_branch: str = field(init=False, repr=False, compare=False)
+    _secret_key: Optional[str] = field(init=False, repr=False, compare=False)
+    _story_directory: Path = field(init=False, repr=False, compare=False)
+    _story_extension: str = field(init=False, repr=False, compare=False)
+    _timestamp_format: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        storage_config = self.data.get("storage", {})
+        self._projects_dir = Path(
+            storage_config.get("projects_dir", "~/.elka/projects")
+        ).expanduser()
+
+        git_config = self.data.get("git", {})
+        self._default_branch = str(git_config.get("default_branch", "main"))
+
+        secret = self.data.get("security", {}).get("secret_key")
+        self._secret_key = None if secret is None else str(secret)
+
+        story_settings = self.data.get("stories", {})
+        self._story_directory = Path(story_settings.get("directory", "stories"))
+        extension = str(story_settings.get("extension", ".md")).strip() or ".md"
+        self._story_extension = (
+            extension if extension.startswith(".") else f".{extension}"
+        )
+        self._timestamp_format = _validated_timestamp_format(
+            str(story_settings.get("timestamp_format", _DEFAULT_TIMESTAMP_FORMAT))
+        )
 
     # ------------------------------------------------------------------
     # Generic helpers
@@ -83,9 +178,7 @@ class Config:
     def projects_dir(self) -> Path:
         """Absolute path where local Git projects are stored."""
 
-        storage_config = self.data.get("storage", {})
-        path_value = storage_config.get("projects_dir", "~/.elka/projects")
-        return Path(path_value).expanduser()
+        return self._projects_dir
 
     # ------------------------------------------------------------------
     # Git helpers
@@ -94,8 +187,7 @@ class Config:
     def default_branch(self) -> str:
         """Fallback branch name used when the repository is detached."""
 
-        git_config = self.data.get("git", {})
-        return str(git_config.get("default_branch", "main"))
+        return self._default_branch
 
     # ------------------------------------------------------------------
     # AI helpers
@@ -197,6 +289,92 @@ class Config:
 
         return 60
 
+    def context_token_budget(self) -> int:
+        """Return the token budget for universe context in prompts (0 = no cap)."""
+
+        env_value = os.getenv("ELKA_CONTEXT_TOKEN_BUDGET")
+        if env_value is not None:
+            try:
+                return max(int(env_value), 0)
+            except ValueError:
+                logger.warning(
+                    "Invalid ELKA_CONTEXT_TOKEN_BUDGET value '%s'; falling back to default.",
+                    env_value,
+                )
+
+        ai_config = self.data.get("ai", {})
+        raw_value = ai_config.get("context_token_budget")
+        if raw_value is not None:
+            try:
+                return max(int(raw_value), 0)
+            except (TypeError, ValueError):
+                logger.warning(
+                    "Invalid ai.context_token_budget value '%s'; using default.",
+                    raw_value,
+                )
+
+        return 0
+
+    def max_diff_chars(self) -> int:
+        """Return the size above which UCE diff previews only summarise a file.
+
+        The limit applies to the combined old and new text of a file, counted
+        in characters; 0 disables summarising.
+        """
+
+        env_value = os.getenv("ELKA_MAX_DIFF_CHARS")
+        if env_value is not None:
+            try:
+                return max(int(env_value), 0)
+            except ValueError:
+                logger.warning(
+                    "Invalid ELKA_MAX_DIFF_CHARS value '%s'; falling back to default.",
+                    env_value,
+                )
+
+        git_config = self.data.get("git", {})
+        raw_value = git_config.get("max_diff_chars")
+        if raw_value is not None:
+            try:
+                return max(int(raw_value), 0)
+            except (TypeError, ValueError):
+                logger.warning(
+                    "Invalid git.max_diff_chars value '%s'; using default.",
+                    raw_value,
+                )
+
+        return 256 * 1024
+
+    def completion_cache_ttl(self) -> int:
+        """Return how long identical AI completions are reused, in seconds.
+
+        The cache is opt-in: identical prompts to a creative model should
+        normally produce fresh text, so the default of 0 disables it.
+        """
+
+        env_value = os.getenv("ELKA_COMPLETION_CACHE_TTL")
+        if env_value is not None:
+            try:
+                return max(int(env_value), 0)
+            except ValueError:
+                logger.warning(
+                    "Invalid ELKA_COMPLETION_CACHE_TTL value '%s'; falling back to default.",
+                    env_value,
+                )
+
+        ai_config = self.data.get("ai", {})
+        raw_value = ai_config.get("completion_cache_ttl")
+        if raw_value is not None:
+            try:
+                return max(int(raw_value), 0)
+            except (TypeError, ValueError):
+                logger.warning(
+                    "Invalid ai.completion_cache_ttl value '%s'; using default.",
+                    raw_value,
+                )
+
+        return 0
+
     def resolve_model_name(self, model_key: str) -> str:
         """Translate a model key (e.g. ``gemini-pro``) to a provider model name."""
 
@@ -255,6 +433,47 @@ class Config:
             return defaults.get("seed_generation", defaults["generation"])
         return defaults.get(task_type, "gemini-pro")
 
+    def get_cascade_for_task(
+        self, task_type: str, default_model: str
+    ) -> list[tuple[str, float]]:
+        """Return ``(model_key, threshold)`` tiers to try in order for a task.
+
+        Tiers come from ``tasks.<task_type>.cascade``, a list of mappings with
+        ``model`` and an optional ``threshold`` (default ``1.0``). A draft from
+        a tier is accepted when its verifier score reaches the threshold; the
+        last tier is always accepted. Without configuration a single tier using
+        ``default_model`` is returned.
+        """
+
+        tasks_config = self.data.get("tasks", {})
+        task_settings = (
+            tasks_config.get(task_type) if isinstance(tasks_config, dict) else None
+        )
+        raw_tiers = (
+            task_settings.get("cascade") if isinstance(task_settings, dict) else None
+        )
+
+        tiers: list[tuple[str, float]] = []
+        if isinstance(raw_tiers, list):
+            for raw_tier in raw_tiers:
+                if not isinstance(raw_tier, dict):
+                    continue
+                model_key = str(raw_tier.get("model", "")).strip()
+                if not model_key:
+                    continue
+                try:
+                    threshold = float(raw_tier.get("threshold", 1.0))
+                except (TypeError, ValueError):
+                    logger.warning(
+                        "Invalid cascade threshold '%s' for task '%s'; using 1.0.",
+                        raw_tier.get("threshold"),
+                        task_type,
+                    )
+                    threshold = 1.0
+                tiers.append((model_key, threshold))
+
+        return tiers or [(default_model, 1.0)]
+
     def get_model_name_for_task(self, task_type: str) -> str:
         """Return the provider-specific model name for a given task type."""
 
@@ -290,47 +509,29 @@ class Config:
     def secret_key(self) -> Optional[str]:
         """Secret key used for symmetric encryption of stored credentials."""
 
-        security_config = self.data.get("security", {})
-        secret = security_config.get("secret_key")
-        if secret is None:
-            return None
-        return str(secret)
+        return self._secret_key
 
     # ------------------------------------------------------------------
     # Story archival helpers
     # ------------------------------------------------------------------
-    @property
-    def _story_settings(self) -> Dict[str, Any]:
-        return self.data.get("stories", {})
-
     @property
     def story_directory(self) -> Path:
         """Relative path inside a project repository for archived stories."""
 
-        directory_value = self._story_settings.get("directory", "stories")
-        return Path(directory_value)
-
-    @property
-    def _story_extension(self) -> str:
-        extension = str(self._story_settings.get("extension", ".md")).strip() or ".md"
-        return extension if extension.startswith(".") else f".{extension}"
-
-    @property
-    def _timestamp_format(self) -> str:
-        default_format = "%Y%m%d-%H%M%S"
-        fmt = str(self._story_settings.get("timestamp_format", default_format))
-        try:
-            # Validate the format string by performing a dry run.
-            datetime.utcnow().strftime(fmt)
-        except ValueError:  # pragma: no cover - defensive branch
-            return default_format
-        return fmt
+        return self._story_directory
 
     def story_filename(self, prefix: str) -> str:
         """Return a sanitized filename for an archived story."""
 
         cleaned_prefix = sanitize_filename(prefix, default="story")
-        timestamp = datetime.utcnow().strftime(self._timestamp_format)
+        if self._timestamp_format == _DEFAULT_TIMESTAMP_FORMAT:
+            now = time.gmtime()
+            timestamp = (
+                f"{now.tm_year:04d}{now.tm_mon:02d}{now.tm_mday:02d}"
+                f"-{now.tm_hour:02d}{now.tm_min:02d}{now.tm_sec:02d}"
+            )
+        else:
+            timestamp = datetime.now(timezone.utc).strftime(self._timestamp_format)
         return f"{cleaned_prefix}-{timestamp}{self._story_extension}"
 
     def ensure_story_directory(self, project_path: Path | str) -> Path:
@@ -342,4 +543,4 @@ class Config:
         return target_directory
 
 
-__all__ = ["Config", "find_config_file", "load_config"]
+__all__ = ["Config", "clear_config_cache", "find_config_file", "load_config"]
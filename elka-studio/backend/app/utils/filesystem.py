@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import re
+from pathlib import Path
 
 _INVALID_CHARS_PATTERN = re.compile(r"[^0-9A-Za-z_-]+")
+_REPEATED_SEPARATOR_PATTERN = re.compile(r"([_-])\1+")
 
 
 def sanitize_filename(value: str, *, default: str = "item") -> str:
@@ -21,10 +23,43 @@ def sanitize_filename(value: str, *, default: str = "item") -> str:
 
     normalized = text.replace(" ", "_")
     sanitized = _INVALID_CHARS_PATTERN.sub("", normalized)
-    sanitized = re.sub(r"_+", "_", sanitized)
-    sanitized = re.sub(r"-+", "-", sanitized)
+    sanitized = _REPEATED_SEPARATOR_PATTERN.sub(r"\1", sanitized)
     sanitized = sanitized.strip("_-.")
     return sanitized or default
 
 
-__all__ = ["sanitize_filename"]
+def write_text_if_changed(
+    path: Path,
+    content: str,
+    encoding: str = "utf-8",
+    *,
+    create_parents: bool = False,
+) -> bool:
+    """Write ``content`` to ``path`` unless the file already holds it.
+
+    Existing files are only read when their size matches the encoded content,
+    so unchanged files cost a ``stat`` and a read instead of a rewrite that
+    would also bump their modification time. With ``create_parents`` missing
+    parent directories are created, but only after a write fails, so writes
+    into existing directories skip the ``mkdir`` call. Returns ``True`` when
+    written.
+    """
+
+    data = content.encode(encoding)
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        if not create_parents:
+            raise
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return True
+
+
+__all__ = ["sanitize_filename", "write_text_if_changed"]
@@ -5,16 +5,23 @@ from __future__ import annotations
 import re
 from unidecode import unidecode
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_INVALID_ID_CHARS_PATTERN = re.compile(r"[^a-z0-9_]+")
+
 
 def generate_entity_id(entity_type: str, name: str) -> str:
     """Generate a deterministic identifier derived from ``name``."""
 
-    normalized = unidecode(name or "").lower()
-    normalized = re.sub(r"\s+", "_", normalized)
-    normalized = re.sub(r"[^a-z0-9_]+", "", normalized)
+    text = name or ""
+    # unidecode leaves ASCII untouched, so most names can skip it.
+    normalized = (text if text.isascii() else unidecode(text)).lower()
+    normalized = _WHITESPACE_PATTERN.sub("_", normalized)
+    normalized = _INVALID_ID_CHARS_PATTERN.sub("", normalized)
     normalized = normalized.strip("_")[:64]
     if not normalized:
-        normalized = re.sub(r"[^a-z0-9_]+", "", (entity_type or "entity").lower())
+        normalized = _INVALID_ID_CHARS_PATTERN.sub(
+            "", (entity_type or "entity").lower()
+        )
     return normalized or "entity"
 
 
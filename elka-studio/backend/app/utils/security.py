@@ -10,7 +10,7 @@ from hashlib import sha256
 from cryptography.fernet import Fernet
 from dotenv import load_dotenv
 
-from .config import Config
+from .config import load_config
 
 load_dotenv()
 
@@ -23,17 +23,21 @@ def _derive_key(secret_key: str) -> bytes:
     return base64.urlsafe_b64encode(digest)
 
 
+@lru_cache(maxsize=32)
+def _fernet(secret_key: str) -> Fernet:
+    """Return a :class:`Fernet` instance for ``secret_key``, built once per key."""
+    return Fernet(_derive_key(secret_key))
+
+
 def encrypt(data: str, key: str) -> str:
     """Encrypt the given string using Fernet symmetric encryption."""
-    fernet = Fernet(_derive_key(key))
-    token = fernet.encrypt(data.encode("utf-8"))
+    token = _fernet(key).encrypt(data.encode("utf-8"))
     return token.decode("utf-8")
 
 
 def decrypt(token: str, key: str) -> str:
     """Decrypt the provided token using Fernet symmetric encryption."""
-    fernet = Fernet(_derive_key(key))
-    data = fernet.decrypt(token.encode("utf-8"))
+    data = _fernet(key).decrypt(token.encode("utf-8"))
     return data.decode("utf-8")
 
 
@@ -45,10 +49,9 @@ def _resolve_secret_key() -> str:
     if secret:
         return secret
 
-    config = Config()
-    secret_from_config = config.secret_key
-    if secret_from_config:
-        return secret_from_config
+    secret_from_config = load_config().get("security", {}).get("secret_key")
+    if secret_from_config is not None and str(secret_from_config):
+        return str(secret_from_config)
 
     raise RuntimeError(
         "SECRET_KEY is not configured. Set the SECRET_KEY environment variable or "
@@ -62,4 +65,20 @@ def get_secret_key() -> str:
     return _resolve_secret_key()
 
 
-__all__ = ["encrypt", "decrypt", "get_secret_key"]
+def encrypt_default(data: str) -> str:
+    """Encrypt ``data`` with the application's secret key.
+
+    Raises :class:`RuntimeError` when no secret key is configured.
+    """
+    return encrypt(data, _resolve_secret_key())
+
+
+def decrypt_default(token: str) -> str:
+    """Decrypt ``token`` with the application's secret key.
+
+    Raises :class:`RuntimeError` when no secret key is configured.
+    """
+    return decrypt(token, _resolve_secret_key())
+
+
+__all__ = ["encrypt", "encrypt_default", "decrypt", "decrypt_default", "get_secret_key"]
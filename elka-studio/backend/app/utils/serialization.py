@@ -0,0 +1,52 @@
+"""JSON helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback
+    orjson = None
+
+
+def json_loads(text: str | bytes) -> Any:
+    """Parse ``text`` as JSON, deferring to :mod:`json` for non-strict input.
+
+    ``orjson`` rejects a few values the standard library accepts (such as
+    ``NaN``); those documents are re-parsed with :func:`json.loads`, which also
+    raises the usual :class:`json.JSONDecodeError` for invalid input.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def json_dumps_pretty(value: Any) -> str:
+    """Serialise ``value`` as UTF-8 JSON indented by two spaces."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, indent=2)
+
+
+def json_dumps_compact(value: Any) -> str:
+    """Serialise ``value`` as UTF-8 JSON without insignificant whitespace."""
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+__all__ = ["json_dumps_compact", "json_dumps_pretty", "json_loads"]
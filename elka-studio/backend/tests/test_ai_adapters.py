@@ -14,6 +14,16 @@ class DummyModels:
         self.calls.append((model, contents))
         return SimpleNamespace(text=f"{model}:{contents}")
 
+    def generate_content_stream(self, model: str, contents: str):
+        self.calls.append((model, contents))
+        yield SimpleNamespace(text="Part one. ", usage_metadata=None)
+        yield SimpleNamespace(
+            text="Part two.",
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=5, candidates_token_count=7, total_token_count=12
+            ),
+        )
+
 
 class DummyClient:
     def __init__(self, api_key: str) -> None:
@@ -63,3 +73,17 @@ def test_get_ai_adapters_without_key_falls_back(monkeypatch):
 
     assert validator is writer
     assert isinstance(validator, HeuristicAIAdapter)
+
+
+def test_gemini_generate_text_stream_yields_chunks(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "unit-test-key")
+    monkeypatch.setenv("AI_PROVIDER", "gemini")
+    monkeypatch.setenv("ELKA_COMPLETION_CACHE_TTL", "0")
+    monkeypatch.setattr("app.adapters.ai.gemini.genai.Client", DummyClient)
+
+    _, writer = get_ai_adapters(Config(data={}))
+    chunks = list(writer.generate_text_stream("Write a chapter"))
+
+    assert "".join(text for text, _ in chunks) == "Part one. Part two."
+    assert chunks[0][1] is None
+    assert chunks[-1][1]["total_tokens"] == 12
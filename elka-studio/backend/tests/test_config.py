@@ -32,6 +32,19 @@ def test_env_overrides_take_precedence(monkeypatch):
     assert config.ai_model == "writer-test"
 
 
+def test_env_overrides_are_read_per_call(monkeypatch):
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.delenv("AI_PROVIDER", raising=False)
+    config = Config(data={})
+    assert config.ai_provider() == "heuristic"
+
+    monkeypatch.setenv("GEMINI_API_KEY", "env-secret")
+    monkeypatch.setenv("ELKA_CONTEXT_TOKEN_BUDGET", "1000")
+
+    assert config.ai_provider() == "gemini"
+    assert config.context_token_budget() == 1000
+
+
 def test_gemini_provider_without_key_falls_back(monkeypatch):
     monkeypatch.delenv("GEMINI_API_KEY", raising=False)
     config = Config(data={"ai": {"provider": "gemini"}})
@@ -39,3 +52,26 @@ def test_gemini_provider_without_key_falls_back(monkeypatch):
 
     config_with_key = Config(data={"ai": {"gemini_api_key": "from-config"}})
     assert config_with_key.get_gemini_api_key() == "from-config"
+
+
+def test_cascade_for_task_defaults_to_single_tier():
+    config = Config(
+        data={
+            "tasks": {
+                "generate_chapter": {
+                    "cascade": [
+                        {"model": "gemini-flash", "threshold": 0.7},
+                        {"model": "gemini-pro"},
+                    ]
+                }
+            }
+        }
+    )
+
+    assert config.get_cascade_for_task("generate_chapter", "fallback") == [
+        ("gemini-flash", 0.7),
+        ("gemini-pro", 1.0),
+    ]
+    assert Config(data={}).get_cascade_for_task("generate_chapter", "writer") == [
+        ("writer", 1.0)
+    ]
@@ -0,0 +1,12 @@
+"""Tests for filesystem helpers."""
+
+from __future__ import annotations
+
+from app.utils.filesystem import sanitize_filename
+
+
+def test_sanitize_filename_collapses_separators() -> None:
+    assert sanitize_filename("  The  Dragon's -- Hoard!  ") == "The_Dragons_-_Hoard"
+    assert sanitize_filename("a__b--c_-d") == "a_b-c_-d"
+    assert sanitize_filename("___") == "item"
+    assert sanitize_filename("", default="story") == "story"
@@ -0,0 +1,12 @@
+"""Tests for identifier helpers."""
+
+from __future__ import annotations
+
+from app.utils.identifiers import generate_entity_id
+
+
+def test_generate_entity_id_normalises_names() -> None:
+    assert generate_entity_id("character", "Sir  Alric\tof Hale") == "sir_alric_of_hale"
+    assert generate_entity_id("place", "Černá Hora!") == "cerna_hora"
+    assert generate_entity_id("Event", "???") == "event"
+    assert generate_entity_id("", "") == "entity"
@@ -0,0 +1,152 @@
+"""Tests for helper functions used by the lore Celery tasks."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.schemas import ChangesetFile
+from app.db.session import Base
+from app.models.task import Task, TaskStatus
+from app.services import task_manager
+from app.tasks import lore_tasks
+from app.tasks.base import BaseTask
+
+
+def test_universe_context_cache_invalidated_by_file_changes(tmp_path: Path) -> None:
+    stories = tmp_path / "Stories"
+    stories.mkdir()
+    (stories / "first.md").write_text("Prvni kapitola", encoding="utf-8")
+    lore_tasks._UNIVERSE_CONTEXT_CACHE.clear()
+
+    first = lore_tasks._load_full_universe_context(tmp_path, project_id=7)
+    assert "Prvni kapitola" in first
+    assert lore_tasks._load_full_universe_context(tmp_path, project_id=7) is first
+
+    (stories / "second.md").write_text("Druha kapitola", encoding="utf-8")
+    refreshed = lore_tasks._load_full_universe_context(tmp_path, project_id=7)
+
+    assert "Druha kapitola" in refreshed
+    assert "Prvni kapitola" in refreshed
+
+
+def test_select_relevant_context_keeps_pinned_and_matching_files() -> None:
+    context = "".join(
+        f"--- START FILE: {label} ---\n{body}\n--- END FILE: {label} ---\n\n"
+        for label, body in [
+            ("timeline.md", "Year one."),
+            ("Stories/dragons.md", "The dragon fleet burns the northern harbour."),
+            ("Stories/farming.md", "Wheat fields and quiet village harvests " * 5),
+            ("Legends/harbour.md", "A legend about the harbour lighthouse keeper."),
+        ]
+    )
+
+    selected = lore_tasks._select_relevant_context(
+        context, "dragon attack on the harbour", max_tokens=50
+    )
+
+    assert "timeline.md" in selected
+    assert "Stories/dragons.md" in selected
+    assert "Legends/harbour.md" in selected
+    assert "Stories/farming.md" not in selected
+    assert lore_tasks._select_relevant_context(context, "x", max_tokens=0) == context
+
+
+def test_render_diff_preview_separates_headers_and_summarises_large_files() -> None:
+    files = [
+        ChangesetFile(path="Legends/a.md", old="one\ntwo\n", new="one\nthree\n"),
+        ChangesetFile(path="Legends/b.md", old="same\n", new="same\n"),
+        ChangesetFile(path="Legends/c.md", new="x" * (300 * 1024)),
+    ]
+
+    preview = lore_tasks._render_diff_preview(files, max_file_chars=256 * 1024)
+
+    assert preview.splitlines()[:2] == ["--- a/Legends/a.md", "+++ b/Legends/a.md"]
+    assert "-two\n+three\n# No diff for Legends/b.md\n" in preview
+    assert preview.endswith("-<0 lines removed>\n+<1 lines added>")
+
+
+@pytest.mark.parametrize("histogram_min_lines", [0, 10_000])
+def test_render_diff_preview_handles_missing_trailing_newline(
+    monkeypatch: pytest.MonkeyPatch, histogram_min_lines: int
+) -> None:
+    monkeypatch.setattr(lore_tasks, "_HISTOGRAM_DIFF_MIN_LINES", histogram_min_lines)
+    files = [
+        ChangesetFile(path="a.md", old="x", new="y\n"),
+        ChangesetFile(path="b.md", old="x\n", new="y"),
+    ]
+
+    lines = lore_tasks._render_diff_preview(files).splitlines()
+
+    marker = "\\ No newline at end of file"
+    assert lines[3:6] == ["-x", marker, "+y"]
+    assert lines[9:] == ["-x", "+y", marker]
+
+
+def test_failed_chapter_fails_the_remaining_saga_chapters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = create_engine(
+        "sqlite:///:memory:", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    TestingSessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+    monkeypatch.setattr(lore_tasks, "SessionLocal", TestingSessionLocal)
+
+    manager = task_manager.TaskManager(session_factory=TestingSessionLocal)
+    monkeypatch.setattr(manager, "_broadcast_update", lambda project_id: None)
+    monkeypatch.setattr(task_manager, "get_task_manager", lambda: manager)
+    monkeypatch.setattr(BaseTask, "update_db_task_tokens", lambda *args: None)
+
+    def _fail_chapter(project_id):
+        raise RuntimeError("writer unavailable")
+
+    monkeypatch.setattr(lore_tasks, "_load_project_resources", _fail_chapter)
+
+    with TestingSessionLocal() as session:
+        saga = Task(
+            project_id=1,
+            type="generate_saga",
+            status=TaskStatus.RUNNING,
+            celery_task_id="saga",
+        )
+        session.add(saga)
+        session.flush()
+        statuses = [TaskStatus.SUCCESS, TaskStatus.PENDING, TaskStatus.PENDING]
+        chapters = [
+            Task(
+                project_id=1,
+                type="generate_chapter",
+                status=status,
+                parent_task_id=saga.id,
+                celery_task_id=f"chapter-{index}",
+            )
+            for index, status in enumerate(statuses, start=1)
+        ]
+        session.add_all(chapters)
+        session.commit()
+
+    result = lore_tasks.generate_chapter_task.apply(
+        args=(chapters[1].id,),
+        kwargs={
+            "project_id": 1,
+            "chapter_index": 2,
+            "total_chapters": 3,
+            "parent_task_id": saga.id,
+        },
+        task_id="chapter-2",
+    )
+
+    assert result.failed()
+    with TestingSessionLocal() as session:
+        stored = {task.id: task.status for task in session.query(Task)}
+    assert stored[saga.id] == TaskStatus.FAILURE
+    assert [stored[chapter.id] for chapter in chapters] == [
+        TaskStatus.SUCCESS,
+        TaskStatus.FAILURE,
+        TaskStatus.FAILURE,
+    ]
+    engine.dispose()
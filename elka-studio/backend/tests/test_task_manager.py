@@ -0,0 +1,35 @@
+"""Tests for task manager helpers that batch status updates."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.models.task import TaskStatus
+from app.services.task_manager import StatusBuffer
+
+
+class _RecordingManager:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    def update_task_status(self, celery_task_id: str, status: str, **kwargs: Any):
+        self.calls.append((celery_task_id, status, kwargs))
+
+
+def test_status_buffer_coalesces_updates_until_flush() -> None:
+    manager = _RecordingManager()
+
+    with StatusBuffer(manager, "celery-1", flush_interval=3600) as buffer:
+        buffer.log("Loading context...", progress=15)
+        buffer.log("Requesting content...", progress=45, input_tokens=3)
+        assert manager.calls == []
+        buffer.log("Done.", progress=100, status=TaskStatus.SUCCESS)
+        assert len(manager.calls) == 1
+
+    assert len(manager.calls) == 2
+    _, status, kwargs = manager.calls[0]
+    assert status == TaskStatus.RUNNING
+    assert kwargs["progress"] == 45
+    assert kwargs["log_message"] == "Loading context...\nRequesting content..."
+    assert kwargs["input_tokens"] == 3
+    assert manager.calls[1][1] == TaskStatus.SUCCESS